@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import queue
 import random
 import threading
+from collections.abc import Sequence
 from importlib.metadata import PackageNotFoundError, version as package_version
 import wx
 import wx.adv
@@ -14,7 +14,7 @@ import dotpad as dp
 from dotpad.serial_driver import PacketType
 
 from .games import TicTacToe, Connect4, Battleship, Puzzle15
-from .games.utils import send_status
+from .games.utils import changed_lines, send_display_lines, send_status
 from .sound import SoundManager
 from .speech import SpeechOutput
 
@@ -25,6 +25,34 @@ APP_TITLE = "Dot Game Center"
 MENU_LINK_LABEL = "visit atguys.com"
 MENU_LINK_URL = "https://www.atguys.com"
 APP_GITHUB_URL = "https://github.com/jage9/dot-game-center"
+# Dot row for each menu item, followed by the atguys.com link row.
+MENU_ROWS = (*(9 + idx * 4 for idx in range(len(MENU_ITEMS))), 38)
+# Keyboard equivalents of DotPad keys while a game is active. The tuples are
+# shared and passed straight to on_pad_keys, so keystrokes allocate nothing.
+_KEYS_F2 = ("f2",)
+GAME_KEY_NAMES: dict[int, tuple[str, ...]] = {
+    wx.WXK_F3: ("f3",),
+    wx.WXK_LEFT: ("panLeft",),
+    wx.WXK_RIGHT: ("panRight",),
+    wx.WXK_UP: ("f1",),
+    wx.WXK_DOWN: ("f4",),
+    wx.WXK_RETURN: _KEYS_F2,
+    wx.WXK_SPACE: _KEYS_F2,
+}
+# DotPad keys that move the game cursor.
+_NAV_KEYS = frozenset({"panLeft", "panRight", "f1", "f4"})
+# DotPad notifications that carry key presses.
+_KEY_PACKETS = frozenset({
+    PacketType.NTF_KEYS_SCROLL,
+    PacketType.NTF_KEYS_PERKINS,
+    PacketType.NTF_KEYS_ROUTING,
+    PacketType.NTF_KEYS_FUNCTION,
+})
+# Serial read timeout in seconds. An idle reader wakes once per timeout, and a
+# write job waits at most this long for the reader to hand over the port.
+PAD_READ_TIMEOUT = 0.05
+# Sound played for each game-over outcome from _game_end_event.
+END_SOUNDS = {"win": "win", "lose": "lose", "draw": "tie"}
 
 
 class MainFrame(wx.Frame):
@@ -35,7 +63,9 @@ class MainFrame(wx.Frame):
         self.app_version = self._resolve_app_version()
         self.pad = None
         self._pad_port = "?"
+        self._last_conn_status: str | None = None
         self._connect_lock = threading.Lock()
+        self._reconnect_timer: wx.CallLater | None = None
         self._connect_pad()
         self.speech = SpeechOutput()
         self.sound = SoundManager()
@@ -45,17 +75,35 @@ class MainFrame(wx.Frame):
         self.current_game = None
         self.about_dialog: wx.Dialog | None = None
         self._cpu_pending = False
-        self._cpu_timer: wx.CallLater | None = None
+        # One reusable one-shot timer for delayed CPU turns.
+        self._cpu_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, lambda _evt: self._run_cpu_turn(), self._cpu_timer)
+        self._rng = random.Random()
         self._puzzle_auto_timer: wx.CallLater | None = None
         self._puzzle_auto_path: list[tuple[int, int]] = []
         self._puzzle_auto_solving = False
         self._menu_render_pending = False
         self._last_menu_state: tuple[int, str] | None = None
+        self._last_grid_cells: dict[tuple[int, int], str] = {}
+        self._menu_base_cells = self._build_menu_base()
+        # Graphics rows last sent by the menu; None forces a full redraw.
+        self._menu_sent_rows: list[bytes] | None = None
+        self._last_status_sent: str | None = None
         self._pad_lock = threading.Lock()
-        self._write_queue: queue.Queue = queue.Queue(maxsize=1)
+        # Held while reading from the pad, so the reader and a write job
+        # waiting for its acks never take each other's packets.
+        self._read_lock = threading.Lock()
+        # Cleared while a write job wants the port; the reader waits on it.
+        self._port_free = threading.Event()
+        self._port_free.set()
+        self._pending_job = None
+        self._job_cv = threading.Condition()
         self._writer_stop = threading.Event()
         self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
         self._writer_thread.start()
+        self._reader_stop = threading.Event()
+        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self._reader_thread.start()
 
         self.panel = wx.Panel(self)
         self.panel.SetName(APP_TITLE)
@@ -82,48 +130,32 @@ class MainFrame(wx.Frame):
         self.menu_link.Bind(wx.EVT_SET_FOCUS, self.on_link_focus)
         self.sizer.Add(self.menu_link, 0, wx.ALL, 6)
 
-        self.game_panel = wx.Panel(self.panel)
-        self.game_panel.SetName("Game")
-        self.game_panel.SetLabel("Game")
-        self.game_sizer = wx.BoxSizer(wx.VERTICAL)
-        self.game_grid = gridlib.Grid(self.game_panel)
-        self.game_grid.CreateGrid(1, 1)
-        self.game_grid.EnableEditing(False)
-        self.game_grid.SetName("Game board")
-        self.game_grid.SetToolTip("Game board")
-        self.game_grid.SetRowLabelSize(56)
-        self.game_grid.SetColLabelSize(30)
-        self.game_grid.Bind(gridlib.EVT_GRID_SELECT_CELL, self._on_grid_select)
-        self.game_sizer.Add(self.game_grid, 1, wx.ALL | wx.EXPAND, 6)
-        self.game_panel.SetSizer(self.game_sizer)
-        self.game_panel.Hide()
-        self.sizer.Add(self.game_panel, 1, wx.ALL | wx.EXPAND, 0)
+        # Game board widgets are built on first start_game.
+        self.game_panel: wx.Panel | None = None
+        self.game_grid: gridlib.Grid | None = None
 
         self.panel.SetSizer(self.sizer)
         self.buttons[0].SetFocus()
         self.request_menu_render(force=True)
 
-        # Poll key packets on the UI thread so serial read/write stays single-threaded.
-        self.key_timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self._on_key_timer, self.key_timer)
-        self.key_timer.Start(50)
-        self.reconnect_timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self._on_reconnect_timer, self.reconnect_timer)
-        self.reconnect_timer.Start(1000)
+        if self.pad is None:
+            self._schedule_reconnect()
 
         self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Bind(wx.EVT_CHAR_HOOK, self._on_char_hook)
 
     def on_close(self, event) -> None:
-        if hasattr(self, "key_timer") and self.key_timer.IsRunning():
-            self.key_timer.Stop()
-        if hasattr(self, "reconnect_timer") and self.reconnect_timer.IsRunning():
-            self.reconnect_timer.Stop()
-        self._writer_stop.set()
-        self._enqueue_pad_write(None)
+        if self._reconnect_timer is not None and self._reconnect_timer.IsRunning():
+            self._reconnect_timer.Stop()
+        with self._job_cv:
+            self._writer_stop.set()
+            self._job_cv.notify_all()
         if self._writer_thread.is_alive():
             self._writer_thread.join(timeout=0.5)
-        if self._cpu_timer is not None and self._cpu_timer.IsRunning():
+        self._reader_stop.set()
+        if self._reader_thread.is_alive():
+            self._reader_thread.join(timeout=0.5)
+        if self._cpu_timer.IsRunning():
             self._cpu_timer.Stop()
         if self._puzzle_auto_timer is not None and self._puzzle_auto_timer.IsRunning():
             self._puzzle_auto_timer.Stop()
@@ -135,7 +167,7 @@ class MainFrame(wx.Frame):
             self.speech.close()
         except Exception:
             pass
-        with self._pad_lock:
+        with self._pad_lock, self._read_lock:
             if self.pad is not None:
                 try:
                     self.pad.clear_all()
@@ -156,7 +188,7 @@ class MainFrame(wx.Frame):
             return False
         try:
             try:
-                new_pad = dp.DotPad()
+                new_pad = dp.DotPad(timeout=PAD_READ_TIMEOUT)
             except Exception:
                 self.pad = None
                 return False
@@ -169,15 +201,41 @@ class MainFrame(wx.Frame):
     def _set_connection_status(self) -> None:
         """Update right status bar field with DotPad connection state."""
         if self.pad is None:
-            self.status_bar.SetStatusText("Dot Pad disconnected", 1)
+            text = "Dot Pad disconnected"
         else:
-            self.status_bar.SetStatusText(f"Dot Pad connected on {self._pad_port}", 1)
+            text = f"Dot Pad connected on {self._pad_port}"
+        # Skip the repaint when a reconnect attempt leaves the text unchanged.
+        if text == self._last_conn_status:
+            return
+        self.status_bar.SetStatusText(text, 1)
+        self._last_conn_status = text
+
+    def _schedule_reconnect(self) -> None:
+        """Arm a one-shot reconnect attempt unless one is already pending."""
+        if self._writer_stop.is_set():
+            return
+        if self._reconnect_timer is not None and self._reconnect_timer.IsRunning():
+            return
+        self._reconnect_timer = wx.CallLater(1000, self._try_reconnect)
 
-    def _on_reconnect_timer(self, _event) -> None:
-        """Retry DotPad connection once per second when disconnected."""
+    def _try_reconnect(self) -> None:
+        """Retry DotPad connection once per second until it succeeds."""
+        self._reconnect_timer = None
         if self.pad is None:
-            self._connect_pad()
+            if self._connect_pad():
+                # A new pad shows nothing we sent before; redraw the game in full.
+                self._forget_sent_game_frame()
+                self.render_game()
             self._set_connection_status()
+        if self.pad is None:
+            self._schedule_reconnect()
+
+    def _forget_sent_game_frame(self) -> None:
+        """Make the current game's next frame resend every row and its status."""
+        game = self.current_game
+        if game is not None:
+            game._last_rows = None
+            game._last_status = None
 
     def _mark_pad_disconnected(self) -> None:
         """Drop current pad handle after I/O failure."""
@@ -187,69 +245,80 @@ class MainFrame(wx.Frame):
             except Exception:
                 pass
             self.pad = None
+        self._menu_sent_rows = None
+        self._last_status_sent = None
+        self._forget_sent_game_frame()
         self._set_connection_status()
+        self._schedule_reconnect()
 
-    def _on_key_timer(self, _event) -> None:
-        """Poll pending key notifications without blocking UI."""
-        if self.pad is None:
+    def _post_key_packet(self, pkt) -> None:
+        """Post the key names in a DotPad packet to the UI; ignore other packets."""
+        if pkt.packet_type not in _KEY_PACKETS:
+            return
+        group_num = pkt.packet_type.value[1]
+        keys = dp.DotPad._decode_keys(pkt.args)
+        if not keys:
             return
-        processed = 0
-        max_per_tick = 6
-        while processed < max_per_tick:
-            if not self._pad_lock.acquire(blocking=False):
-                break
+        names = dp.DotPad._map_key_names(group_num, keys)
+        if names:
+            wx.CallAfter(self.on_pad_keys, names)
+
+    def _reader_loop(self) -> None:
+        """Read DotPad key packets on a background thread and post them to the UI."""
+        while not self._reader_stop.is_set():
+            pad = self.pad
+            if pad is None:
+                self._reader_stop.wait(0.25)
+                continue
+            # Let a queued write job take the port before blocking again.
+            self._port_free.wait()
             try:
-                ser = getattr(self.pad, "_ser", None)
-                # Avoid blocking UI: only parse when serial bytes are already queued.
-                if ser is None or ser.in_waiting <= 0:
-                    break
-                pkt = self.pad.read_packet(timeout=0.001)
+                with self._read_lock:
+                    if self.pad is not pad:
+                        continue
+                    # Blocks in the serial read while idle; the write lock
+                    # stays free, so a write job only waits out this one read.
+                    pkt = pad.read_packet(timeout=PAD_READ_TIMEOUT)
             except Exception:
-                self._mark_pad_disconnected()
-                break
-            finally:
-                self._pad_lock.release()
-            if not pkt or pkt.packet_type is None:
-                break
-            if pkt.packet_type in (
-                PacketType.NTF_KEYS_SCROLL,
-                PacketType.NTF_KEYS_PERKINS,
-                PacketType.NTF_KEYS_ROUTING,
-                PacketType.NTF_KEYS_FUNCTION,
-            ):
-                group_num = pkt.packet_type.value[1]
-                keys = self.pad._decode_keys(pkt.args)
-                if not keys:
-                    processed += 1
-                    continue
-                names = self.pad._map_key_names(group_num, keys)
-                if names:
-                    self.on_pad_keys(names)
-            processed += 1
+                wx.CallAfter(self._mark_pad_disconnected)
+                # Give the UI thread time to drop the failed handle.
+                self._reader_stop.wait(0.5)
+                continue
+            if pkt and pkt.packet_type is not None:
+                self._post_key_packet(pkt)
 
     def _writer_loop(self) -> None:
         """Run queued DotPad write jobs on a background thread."""
         while not self._writer_stop.is_set():
-            try:
-                job = self._write_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
+            with self._job_cv:
+                while self._pending_job is None and not self._writer_stop.is_set():
+                    self._job_cv.wait()
+                job = self._pending_job
+                self._pending_job = None
             if job is None:
                 continue
-            with self._pad_lock:
-                try:
+            self._port_free.clear()
+            try:
+                with self._pad_lock, self._read_lock:
                     job()
-                except Exception:
-                    wx.CallAfter(self._mark_pad_disconnected)
+            except Exception:
+                wx.CallAfter(self._mark_pad_disconnected)
+            finally:
+                self._port_free.set()
 
     def _enqueue_pad_write(self, job) -> None:
         """Queue a DotPad write job, replacing stale pending work."""
-        if self._write_queue.full():
-            try:
-                self._write_queue.get_nowait()
-            except queue.Empty:
-                pass
-        self._write_queue.put_nowait(job)
+        with self._job_cv:
+            self._pending_job = job
+            self._job_cv.notify()
+
+    def _send_status_if_changed(self, message: str) -> None:
+        """Send the pad status line from a write job unless it already shows message."""
+        if message == self._last_status_sent:
+            return
+        sent = send_status(self.pad, message, self._post_key_packet)
+        # After a failed send, resend the status next time.
+        self._last_status_sent = message if sent else None
 
     def on_button_focus(self, event: wx.FocusEvent, idx: int) -> None:
         """Track menu focus changes from keyboard navigation."""
@@ -309,6 +378,19 @@ class MainFrame(wx.Frame):
         else:
             game = Puzzle15()
         self.current_game = game
+        # Resolve per-game helpers once instead of isinstance chains per input.
+        self._grid_cells_impl = {
+            TicTacToe: self._grid_cells_tictactoe,
+            Connect4: self._grid_cells_connect4,
+            Battleship: self._grid_cells_battleship,
+            Puzzle15: self._grid_cells_puzzle15,
+        }[type(game)]
+        self._capture_impl = {
+            TicTacToe: self._capture_tictactoe,
+            Connect4: self._capture_connect4,
+            Battleship: self._capture_battleship,
+            Puzzle15: self._capture_puzzle15,
+        }[type(game)]
         self._cpu_pending = False
         self.mode = "game"
         self._last_menu_state = None
@@ -316,6 +398,7 @@ class MainFrame(wx.Frame):
         for btn in self.buttons:
             btn.Hide()
         self.menu_link.Hide()
+        self._ensure_game_panel()
         self.game_panel.Show()
         self.game_panel.SetName(game_name)
         self.game_panel.SetLabel(game_name)
@@ -335,13 +418,14 @@ class MainFrame(wx.Frame):
     def back_to_menu(self) -> None:
         self._cancel_puzzle_autosolve()
         self._cpu_pending = False
-        if self._cpu_timer is not None and self._cpu_timer.IsRunning():
+        if self._cpu_timer.IsRunning():
             self._cpu_timer.Stop()
         self.mode = "menu"
         self.current_game = None
-        self.game_panel.Hide()
-        self.game_panel.SetName("Game")
-        self.game_panel.SetLabel("Game")
+        if self.game_panel is not None:
+            self.game_panel.Hide()
+            self.game_panel.SetName("Game")
+            self.game_panel.SetLabel("Game")
         for btn in self.buttons:
             btn.Show()
         self.menu_link.Show()
@@ -351,6 +435,26 @@ class MainFrame(wx.Frame):
         self.SetTitle(APP_TITLE)
         self.request_menu_render(force=True)
 
+    def _ensure_game_panel(self) -> None:
+        """Create the game panel and board grid the first time a game starts."""
+        if self.game_panel is not None:
+            return
+        self.game_panel = wx.Panel(self.panel)
+        self.game_panel.SetName("Game")
+        self.game_panel.SetLabel("Game")
+        self.game_sizer = wx.BoxSizer(wx.VERTICAL)
+        # The table is created at the first game's size in _setup_game_grid.
+        self.game_grid = gridlib.Grid(self.game_panel)
+        self.game_grid.SetName("Game board")
+        self.game_grid.SetToolTip("Game board")
+        self.game_grid.SetRowLabelSize(56)
+        self.game_grid.SetColLabelSize(30)
+        self.game_grid.Bind(gridlib.EVT_GRID_SELECT_CELL, self._on_grid_select)
+        self.game_sizer.Add(self.game_grid, 1, wx.ALL | wx.EXPAND, 6)
+        self.game_panel.SetSizer(self.game_sizer)
+        self.game_panel.Hide()
+        self.sizer.Add(self.game_panel, 1, wx.ALL | wx.EXPAND, 0)
+
     @staticmethod
     def _resolve_app_version() -> str:
         """Resolve packaged app version string."""
@@ -445,10 +549,9 @@ class MainFrame(wx.Frame):
             # Leave one blank line before GitHub URL.
             builder.render_text("github.com/jage9/", row=29, col=1)
             builder.render_text("dot-game-center", row=33, col=1)
-            rows = builder.rows()
-            for i, row_bytes in enumerate(rows, start=1):
-                self.pad.send_display_line(i, row_bytes)
-            send_status(self.pad, "F2 CLOSE ABOUT")
+            send_display_lines(self.pad, enumerate(builder.rows(), start=1), self._post_key_packet)
+            self._menu_sent_rows = None
+            self._send_status_if_changed("F2 CLOSE ABOUT")
 
         self._enqueue_pad_write(about_job)
 
@@ -467,9 +570,10 @@ class MainFrame(wx.Frame):
         """Draw a 3x3 rectangle indicator."""
         builder.draw_rectangle(row, col, row + 2, col + 2)
 
-    def on_pad_keys(self, names: list[str]) -> None:
+    def on_pad_keys(self, names: Sequence[str]) -> None:
+        keys = frozenset(names)
         if self.mode == "about":
-            if "f2" in names and self.about_dialog is not None:
+            if "f2" in keys and self.about_dialog is not None:
                 try:
                     self.about_dialog.EndModal(wx.ID_OK)
                 except Exception:
@@ -477,7 +581,7 @@ class MainFrame(wx.Frame):
             return
 
         # Global menu chord
-        if "f1" in names and "f4" in names:
+        if "f1" in keys and "f4" in keys:
             self.back_to_menu()
             return
 
@@ -487,43 +591,44 @@ class MainFrame(wx.Frame):
         if self.mode == "menu":
             menu_count = len(MENU_ITEMS) + 1  # plus atguys.com link
             nav_pressed = False
-            if "f1" in names:
+            if "f1" in keys:
                 nav_pressed = True
                 self.menu_index = (self.menu_index - 1) % menu_count
                 self._focus_menu_index(self.menu_index)
-            if "f4" in names:
+            if "f4" in keys:
                 nav_pressed = True
                 self.menu_index = (self.menu_index + 1) % menu_count
                 self._focus_menu_index(self.menu_index)
-            if "f2" in names:
+            if "f2" in keys:
                 self.on_menu_select(self.menu_index)
                 return
             if nav_pressed:
-                # Full redraw each keypress avoids stale indicator dots.
-                self.request_menu_render(force=True)
+                self.request_menu_render()
         else:
             if self.current_game:
                 if self._game_over():
-                    if "f3" in names:
+                    if "f3" in keys:
                         self.back_to_menu()
                         return
                     return
-                if "f3" in names and isinstance(self.current_game, Puzzle15):
+                if "f3" in keys and isinstance(self.current_game, Puzzle15):
                     self._start_puzzle_autosolve()
                     return
                 before = self._capture_game_state(self.current_game)
                 self.current_game.handle_key(names)
                 self._speak_game_event(names, before, self.current_game)
                 self._play_human_sound(names, before, self.current_game)
-                self._update_game_grid()
-                self.render_game()
+                # Ignored keys and repeated rejections leave nothing new to draw.
+                if self._capture_game_state(self.current_game) != before:
+                    self._update_game_grid()
+                    self.render_game()
                 if self._should_schedule_cpu_turn(names, before, self.current_game):
                     self._schedule_cpu_turn()
 
     def _on_char_hook(self, event: wx.KeyEvent) -> None:
         """Handle keyboard shortcuts for game navigation."""
-        code = event.GetKeyCode()
         if self.mode == "game":
+            code = event.GetKeyCode()
             if code == wx.WXK_TAB:
                 # Disable Tab navigation in games; use DotPad keys/arrows instead.
                 return
@@ -532,23 +637,9 @@ class MainFrame(wx.Frame):
                 return
             if self._cpu_pending:
                 return
-            if code == wx.WXK_F3:
-                self.on_pad_keys(["f3"])
-                return
-            if code == wx.WXK_LEFT:
-                self.on_pad_keys(["panLeft"])
-                return
-            if code == wx.WXK_RIGHT:
-                self.on_pad_keys(["panRight"])
-                return
-            if code == wx.WXK_UP:
-                self.on_pad_keys(["f1"])
-                return
-            if code == wx.WXK_DOWN:
-                self.on_pad_keys(["f4"])
-                return
-            if code in (wx.WXK_RETURN, wx.WXK_SPACE):
-                self.on_pad_keys(["f2"])
+            names = GAME_KEY_NAMES.get(code)
+            if names is not None:
+                self.on_pad_keys(names)
                 return
         event.Skip()
 
@@ -564,16 +655,22 @@ class MainFrame(wx.Frame):
             rows, cols = 4, 4
         else:
             rows, cols = 10, 10
-        cur_rows = self.game_grid.GetNumberRows()
-        cur_cols = self.game_grid.GetNumberCols()
-        if cur_rows < rows:
-            self.game_grid.AppendRows(rows - cur_rows)
-        elif cur_rows > rows:
-            self.game_grid.DeleteRows(0, cur_rows - rows)
-        if cur_cols < cols:
-            self.game_grid.AppendCols(cols - cur_cols)
-        elif cur_cols > cols:
-            self.game_grid.DeleteCols(0, cur_cols - cols)
+        if self.game_grid.GetTable() is None:
+            self.game_grid.CreateGrid(rows, cols)
+            self.game_grid.EnableEditing(False)
+        else:
+            cur_rows = self.game_grid.GetNumberRows()
+            cur_cols = self.game_grid.GetNumberCols()
+            if cur_rows < rows:
+                self.game_grid.AppendRows(rows - cur_rows)
+            elif cur_rows > rows:
+                self.game_grid.DeleteRows(0, cur_rows - rows)
+            if cur_cols < cols:
+                self.game_grid.AppendCols(cols - cur_cols)
+            elif cur_cols > cols:
+                self.game_grid.DeleteCols(0, cur_cols - cols)
+        # Grid shape or labels may have changed; force a full cell rewrite.
+        self._last_grid_cells = {}
         self.game_grid.SetDefaultColSize(42, resizeExistingCols=True)
         self.game_grid.SetDefaultRowSize(28, resizeExistingRows=True)
         if isinstance(self.current_game, TicTacToe):
@@ -601,41 +698,64 @@ class MainFrame(wx.Frame):
         """Mirror current game state into the on-screen grid."""
         if not self.current_game:
             return
-        if isinstance(self.current_game, TicTacToe):
-            for r in range(3):
-                for c in range(3):
-                    cell = self.current_game.board[r][c] or "."
-                    self.game_grid.SetCellValue(r, c, cell)
-            self.game_grid.SetGridCursor(self.current_game.sel_row, self.current_game.sel_col)
-        elif isinstance(self.current_game, Connect4):
-            for r in range(self.current_game.rows):
-                for c in range(self.current_game.cols):
-                    val = self.current_game.board[r][c]
-                    cell = "X" if val == 1 else "O" if val == 2 else "."
-                    self.game_grid.SetCellValue(r, c, cell)
-            self.game_grid.SetGridCursor(0, self.current_game.sel_col)
-        elif isinstance(self.current_game, Battleship):
-            if self.current_game.phase == "place":
-                board = self.current_game.player_board
-                for r in range(10):
-                    for c in range(10):
-                        cell = "S" if board[r][c] else "."
-                        self.game_grid.SetCellValue(r, c, cell)
-            else:
-                shots = self.current_game.player_shots
-                for r in range(10):
-                    for c in range(10):
-                        shot = shots[r][c]
-                        cell = "." if shot == 0 else "o" if shot == 1 else "x"
-                        self.game_grid.SetCellValue(r, c, cell)
-            self.game_grid.SetGridCursor(self.current_game.sel_row, self.current_game.sel_col)
-        elif isinstance(self.current_game, Puzzle15):
-            for r in range(4):
-                for c in range(4):
-                    val = self.current_game.board[r][c]
-                    self.game_grid.SetCellValue(r, c, str(val) if val else ".")
-            self.game_grid.SetGridCursor(self.current_game.sel_row, self.current_game.sel_col)
-        self.game_grid.ForceRefresh()
+        cells, cursor = self._grid_cells_impl(self.current_game)
+        last = self._last_grid_cells
+        changed = [(key, value) for key, value in cells.items() if last.get(key) != value]
+        self._last_grid_cells = cells
+        if changed:
+            # Batch the writes so the grid repaints once in EndBatch.
+            self.game_grid.BeginBatch()
+            try:
+                for (r, c), value in changed:
+                    self.game_grid.SetCellValue(r, c, value)
+            finally:
+                self.game_grid.EndBatch()
+        self.game_grid.SetGridCursor(*cursor)
+
+    @staticmethod
+    def _grid_cells_tictactoe(game: TicTacToe) -> tuple[dict[tuple[int, int], str], tuple[int, int]]:
+        """Return grid cell text and cursor for Tic Tac Toe."""
+        # board is rebuilt from the bitboards on each access; read it once.
+        board = game.board
+        cells = {(r, c): board[r][c] or "." for r in range(3) for c in range(3)}
+        return cells, (game.sel_row, game.sel_col)
+
+    @staticmethod
+    def _grid_cells_connect4(game: Connect4) -> tuple[dict[tuple[int, int], str], tuple[int, int]]:
+        """Return grid cell text and cursor for Connect 4."""
+        cells: dict[tuple[int, int], str] = {}
+        for r in range(game.rows):
+            for c in range(game.cols):
+                val = game.board[r][c]
+                cells[r, c] = "X" if val == 1 else "O" if val == 2 else "."
+        return cells, (0, game.sel_col)
+
+    @staticmethod
+    def _grid_cells_battleship(game: Battleship) -> tuple[dict[tuple[int, int], str], tuple[int, int]]:
+        """Return grid cell text and cursor for Battleship."""
+        cells: dict[tuple[int, int], str] = {}
+        if game.phase == "place":
+            board = game.player_board
+            for r in range(10):
+                for c in range(10):
+                    cells[r, c] = "S" if board[r * 10 + c] else "."
+        else:
+            shots = game.player_shots
+            for r in range(10):
+                for c in range(10):
+                    shot = shots[r * 10 + c]
+                    cells[r, c] = "." if shot == 0 else "o" if shot == 1 else "x"
+        return cells, (game.sel_row, game.sel_col)
+
+    @staticmethod
+    def _grid_cells_puzzle15(game: Puzzle15) -> tuple[dict[tuple[int, int], str], tuple[int, int]]:
+        """Return grid cell text and cursor for the 15 puzzle."""
+        cells: dict[tuple[int, int], str] = {}
+        for r in range(4):
+            for c in range(4):
+                val = game.board[r][c]
+                cells[r, c] = str(val) if val else "."
+        return cells, (game.sel_row, game.sel_col)
 
     def _on_grid_select(self, event: gridlib.GridEvent) -> None:
         """Handle cell selection changes from keyboard/mouse navigation."""
@@ -686,6 +806,28 @@ class MainFrame(wx.Frame):
         if self.pad is None:
             return
         builder = self.pad.builder()
+        builder.buffer.cells[:] = self._menu_base_cells
+        self._draw_menu_indicator(builder, MENU_ROWS[self.menu_index], 1)
+        rows = builder.rows()
+
+        def menu_job() -> None:
+            if self.pad is None:
+                return
+            # Diff against what is on the pad so a move only resends the old
+            # and new indicator lines; other jobs clear this after drawing.
+            sent = send_display_lines(self.pad, changed_lines(rows, self._menu_sent_rows), self._post_key_packet)
+            # A line the pad did not take may still show stale dots; redraw
+            # the whole menu next time.
+            self._menu_sent_rows = rows if sent else None
+            self._send_status_if_changed("F1/F4 MOVE F2 SELECT")
+
+        self._enqueue_pad_write(menu_job)
+        self._last_menu_state = state
+
+    @staticmethod
+    def _build_menu_base() -> list[int]:
+        """Rasterize the menu without an indicator and return its cell bytes."""
+        builder = dp.DotPadBuilder.empty()
         # Header occupies the first 8 dot rows.
         # Keep 3-dot cell spacing so capital prefix has its own cell.
         builder.render_text_dots("6", row=1, col=1)   # D prefix
@@ -697,108 +839,90 @@ class MainFrame(wx.Frame):
         builder.render_text_dots("6", row=1, col=34)  # C prefix
         builder.render_text("c", row=1, col=37)
         builder.render_text("enter", row=1, col=40)
-
-        menu_top = 9  # Move menu list down by 8 dot rows.
         for idx, label in enumerate(MENU_ITEMS):
-            row = menu_top + idx * 4
-            if idx == self.menu_index:
-                self._draw_menu_indicator(builder, row, 1)
-            builder.render_text(label, row=row, col=6)
-        link_row = self._menu_item_row(len(MENU_ITEMS))
-        if self.menu_index == len(MENU_ITEMS):
-            self._draw_menu_indicator(builder, link_row, 1)
-        builder.render_text(MENU_LINK_LABEL, row=link_row, col=5)
+            builder.render_text(label, row=MENU_ROWS[idx], col=6)
+        builder.render_text(MENU_LINK_LABEL, row=MENU_ROWS[len(MENU_ITEMS)], col=5)
+        return builder.buffer.cells[:]
 
-        rows = builder.rows()
-
-        def full_job() -> None:
-            if self.pad is None:
-                return
-            for i, row_bytes in enumerate(rows, start=1):
-                self.pad.send_display_line(i, row_bytes)
-            send_status(self.pad, "F1/F4 MOVE F2 SELECT")
-
-        self._enqueue_pad_write(full_job)
-        self._last_menu_state = state
+    def _capture_game_state(self, game: object) -> dict[str, object]:
+        """Capture minimal game state for speech and redraw diffing."""
+        state = self._capture_impl(game)
+        state["winner"] = getattr(game, "winner", None)
+        return state
 
     @staticmethod
-    def _menu_item_row(index: int) -> int:
-        """Return dot row for a menu item index."""
-        if index < len(MENU_ITEMS):
-            return 9 + index * 4
-        return 38
+    def _capture_tictactoe(game: TicTacToe) -> dict[str, object]:
+        """Capture Tic Tac Toe pre-input state."""
+        return {
+            "sel_row": game.sel_row,
+            "sel_col": game.sel_col,
+            # board already returns a fresh list built from the bitboards.
+            "board": game.board,
+            "player_marks": game.marks_placed[game.player_mark],
+            "ai_marks": game.marks_placed[game.ai_mark],
+        }
 
     @staticmethod
-    def _capture_game_state(game: object) -> dict[str, object]:
-        """Capture minimal pre-input state for speech diffing."""
-        state: dict[str, object] = {}
-        if isinstance(game, TicTacToe):
-            state["sel_row"] = game.sel_row
-            state["sel_col"] = game.sel_col
-            state["board"] = [row[:] for row in game.board]
-        elif isinstance(game, Connect4):
-            state["sel_col"] = game.sel_col
-            state["board"] = [row[:] for row in game.board]
-        elif isinstance(game, Battleship):
-            state["sel_row"] = game.sel_row
-            state["sel_col"] = game.sel_col
-            state["phase"] = game.phase
-            state["orientation"] = game.orientation
-            state["place_index"] = game.place_index
-            state["player_shots"] = [row[:] for row in game.player_shots]
-        elif isinstance(game, Puzzle15):
-            state["sel_row"] = game.sel_row
-            state["sel_col"] = game.sel_col
-            state["board"] = [row[:] for row in game.board]
-        state["winner"] = getattr(game, "winner", None)
-        return state
+    def _capture_connect4(game: Connect4) -> dict[str, object]:
+        """Capture Connect 4 pre-input state."""
+        return {
+            "sel_col": game.sel_col,
+            "board": [row[:] for row in game.board],
+            "player_pieces": game.pieces_dropped[1],
+            "cpu_pieces": game.pieces_dropped[2],
+        }
 
     @staticmethod
-    def _count_token(board: list[list[object]], value: object) -> int:
-        return sum(1 for row in board for cell in row if cell == value)
+    def _capture_battleship(game: Battleship) -> dict[str, object]:
+        """Capture Battleship pre-input state."""
+        return {
+            "sel_row": game.sel_row,
+            "sel_col": game.sel_col,
+            "phase": game.phase,
+            "orientation": game.orientation,
+            "place_index": game.place_index,
+            "player_shots": bytes(game.player_shots),
+            "shots_fired": game.shots_fired,
+            "message": game.last_message_braille,
+        }
 
     @staticmethod
-    def _count_marked(board: list[list[int]]) -> int:
-        return sum(1 for row in board for cell in row if cell != 0)
+    def _capture_puzzle15(game: Puzzle15) -> dict[str, object]:
+        """Capture 15 puzzle pre-input state."""
+        return {
+            "sel_row": game.sel_row,
+            "sel_col": game.sel_col,
+            "board": [row[:] for row in game.board],
+        }
 
     @staticmethod
-    def _new_shot_coord(before: list[list[int]], after: list[list[int]]) -> tuple[int, int, int] | None:
+    def _new_shot_coord(before: bytes, after: bytes | bytearray) -> tuple[int, int, int] | None:
         """Return (row, col, shot_value) for newly marked shot cell."""
-        for r in range(len(after)):
-            for c in range(len(after[r])):
-                if before[r][c] == 0 and after[r][c] != 0:
-                    return r, c, after[r][c]
-        return None
+        idx = next((i for i, (prev, cur) in enumerate(zip(before, after)) if not prev and cur), None)
+        if idx is None:
+            return None
+        r, c = divmod(idx, 10)
+        return r, c, after[idx]
 
-    def _should_schedule_cpu_turn(self, names: list[str], before: dict[str, object], game: object) -> bool:
+    def _should_schedule_cpu_turn(self, names: Sequence[str], before: dict[str, object], game: object) -> bool:
         """Return True if this input created a valid human move and CPU should play."""
-        if "f2" not in names or getattr(game, "winner", None) is not None:
+        keys = frozenset(names)
+        if "f2" not in keys or getattr(game, "winner", None) is not None:
             return False
         if isinstance(game, TicTacToe):
-            prev = before.get("board")
-            if not isinstance(prev, list):
-                return False
-            p_before = self._count_token(prev, game.player_mark)
-            o_before = self._count_token(prev, game.ai_mark)
-            p_now = self._count_token(game.board, game.player_mark)
-            o_now = self._count_token(game.board, game.ai_mark)
-            return p_now > p_before and o_now == o_before
+            return (
+                game.marks_placed[game.player_mark] != before.get("player_marks")
+                and game.marks_placed[game.ai_mark] == before.get("ai_marks")
+            )
         if isinstance(game, Connect4):
-            prev = before.get("board")
-            if not isinstance(prev, list):
-                return False
-            p_before = self._count_token(prev, 1)
-            c_before = self._count_token(prev, 2)
-            p_now = self._count_token(game.board, 1)
-            c_now = self._count_token(game.board, 2)
-            return p_now > p_before and c_now == c_before
+            return (
+                game.pieces_dropped[1] != before.get("player_pieces")
+                and game.pieces_dropped[2] == before.get("cpu_pieces")
+            )
         if isinstance(game, Battleship):
             if before.get("phase") != "attack" or game.phase != "attack":
                 return False
-            prev = before.get("player_shots")
-            if not isinstance(prev, list):
-                return False
-            return self._count_marked(game.player_shots) > self._count_marked(prev)
+            return game.shots_fired != before.get("shots_fired")
         if isinstance(game, Puzzle15):
             return False
         return False
@@ -884,10 +1008,7 @@ class MainFrame(wx.Frame):
         game.sel_row = r
         game.sel_col = c
         game.handle_key(["f2"])
-        changed = any(
-            game.board[rr][cc] != before[rr][cc]
-            for rr in range(4) for cc in range(4)
-        )
+        changed = game.board != before
         if changed:
             self.sound.play("slide")
         self._update_game_grid()
@@ -895,12 +1016,7 @@ class MainFrame(wx.Frame):
 
         if game.winner is not None:
             self._cancel_puzzle_autosolve()
-            end_msg = self._game_end_message(game)
-            if end_msg:
-                self._set_status(end_msg)
-                if self.speech.enabled:
-                    self.speech.speak(end_msg, interrupt=False)
-                self.sound.play("win")
+            self._announce_game_end(game)
             return
         if not self._puzzle_auto_path:
             self._cancel_puzzle_autosolve()
@@ -910,10 +1026,8 @@ class MainFrame(wx.Frame):
     def _schedule_cpu_turn(self) -> None:
         """Schedule CPU move 1.5-2.0 seconds after player action."""
         self._cpu_pending = True
-        if self._cpu_timer is not None and self._cpu_timer.IsRunning():
-            self._cpu_timer.Stop()
-        delay_ms = random.randint(1500, 2000)
-        self._cpu_timer = wx.CallLater(delay_ms, self._run_cpu_turn)
+        # Starting a running wx.Timer restarts it.
+        self._cpu_timer.StartOnce(self._rng.randint(1500, 2000))
 
     def _run_cpu_turn(self) -> None:
         """Execute delayed CPU turn and refresh game/speech."""
@@ -929,7 +1043,7 @@ class MainFrame(wx.Frame):
         elif isinstance(self.current_game, Connect4):
             did_move = self.current_game.run_ai_turn()
         elif isinstance(self.current_game, Battleship):
-            before_enemy = [row[:] for row in self.current_game.enemy_shots]
+            before_enemy = bytes(self.current_game.enemy_shots)
             did_move = self.current_game.run_cpu_turn()
             if did_move:
                 shot = self._new_shot_coord(before_enemy, self.current_game.enemy_shots)
@@ -958,9 +1072,10 @@ class MainFrame(wx.Frame):
         if isinstance(game, TicTacToe):
             prev = before.get("board")
             if isinstance(prev, list):
+                board = game.board
                 for rr in range(3):
                     for cc in range(3):
-                        if prev[rr][cc] == "" and game.board[rr][cc] == game.ai_mark:
+                        if prev[rr][cc] == "" and board[rr][cc] == game.ai_mark:
                             msg = f"Computer places {game.ai_mark} at {chr(ord('A') + rr)}{cc + 1}"
                             break
                     if msg:
@@ -984,17 +1099,7 @@ class MainFrame(wx.Frame):
                 self.speech.speak(msg)
 
         if getattr(game, "winner", None) is not None:
-            end_msg = self._game_end_message(game)
-            if end_msg:
-                self._set_status(end_msg)
-                if self.speech.enabled:
-                    self.speech.speak(end_msg, interrupt=False)
-                if "YOU WIN" in end_msg.upper():
-                    self.sound.play("win")
-                elif "YOU LOSE" in end_msg.upper():
-                    self.sound.play("lose")
-                elif "DRAW" in end_msg.upper():
-                    self.sound.play("tie")
+            self._announce_game_end(game)
 
     def _announce_battleship_user_shot(self, game: Battleship, square: str, hit: bool) -> None:
         """Speak/status player Battleship shot timed to SFX."""
@@ -1010,17 +1115,7 @@ class MainFrame(wx.Frame):
         game.pending_user_sunk_speech = None
         self.render_game()
         if getattr(game, "winner", None) is not None:
-            end_msg = self._game_end_message(game)
-            if end_msg:
-                self._set_status(end_msg)
-                if self.speech.enabled:
-                    self.speech.speak(end_msg, interrupt=False)
-                if "YOU WIN" in end_msg.upper():
-                    self.sound.play("win")
-                elif "YOU LOSE" in end_msg.upper():
-                    self.sound.play("lose")
-                elif "DRAW" in end_msg.upper():
-                    self.sound.play("tie")
+            self._announce_game_end(game)
 
     def _announce_battleship_cpu_shot(self, game: Battleship, square: str, hit: bool) -> None:
         """Speak/status CPU Battleship shot timed to SFX."""
@@ -1034,24 +1129,14 @@ class MainFrame(wx.Frame):
                 self.speech.speak(outcome)
         self.render_game()
         if getattr(game, "winner", None) is not None:
-            end_msg = self._game_end_message(game)
-            if end_msg:
-                self._set_status(end_msg)
-                if self.speech.enabled:
-                    self.speech.speak(end_msg, interrupt=False)
-                if "YOU WIN" in end_msg.upper():
-                    self.sound.play("win")
-                elif "YOU LOSE" in end_msg.upper():
-                    self.sound.play("lose")
-                elif "DRAW" in end_msg.upper():
-                    self.sound.play("tie")
-
-    def _speak_game_event(self, names: list[str], before: dict[str, object], game: object) -> None:
+            self._announce_game_end(game)
+
+    def _speak_game_event(self, names: Sequence[str], before: dict[str, object], game: object) -> None:
         """Speak movement and placement updates as one combined message."""
         parts: list[str] = []
-        nav = {"panLeft", "panRight", "f1", "f4"}
-        moved = any(key in names for key in nav)
-        placed = "f2" in names
+        keys = frozenset(names)
+        moved = not _NAV_KEYS.isdisjoint(keys)
+        placed = "f2" in keys
 
         if isinstance(game, TicTacToe):
             if moved:
@@ -1071,12 +1156,19 @@ class MainFrame(wx.Frame):
                 if isinstance(prev, list):
                     player_square = None
                     ai_square = None
-                    for rr in range(3):
-                        for cc in range(3):
-                            if prev[rr][cc] == "" and game.board[rr][cc] == game.player_mark:
-                                player_square = f"{chr(ord('A') + rr)}{cc + 1}"
-                            if prev[rr][cc] == "" and game.board[rr][cc] == game.ai_mark:
-                                ai_square = f"{chr(ord('A') + rr)}{cc + 1}"
+                    player_mark = game.player_mark
+                    ai_mark = game.ai_mark
+                    # One pass finds both new marks, stopping once both are seen.
+                    for rr, (prev_row, row) in enumerate(zip(prev, game.board)):
+                        for cc, (was, now) in enumerate(zip(prev_row, row)):
+                            if was == "" and now:
+                                square = f"{chr(ord('A') + rr)}{cc + 1}"
+                                if now == player_mark:
+                                    player_square = square
+                                elif now == ai_mark:
+                                    ai_square = square
+                        if player_square and ai_square:
+                            break
                     if player_square:
                         parts.append(f"You place {game.player_mark} at {player_square}")
                     if ai_square:
@@ -1091,9 +1183,9 @@ class MainFrame(wx.Frame):
                 prev = before.get("board")
                 if isinstance(prev, list):
                     dropped_col = None
-                    for rr in range(game.rows):
-                        for cc in range(game.cols):
-                            if prev[rr][cc] == 0 and game.board[rr][cc] == 1:
+                    for prev_row, row in zip(prev, game.board):
+                        for cc, (was, now) in enumerate(zip(prev_row, row)):
+                            if was == 0 and now == 1:
                                 dropped_col = cc + 1
                                 break
                         if dropped_col is not None:
@@ -1115,30 +1207,22 @@ class MainFrame(wx.Frame):
                         else:
                             parts.append(square)
                     else:
-                        shot = game.player_shots[game.sel_row][game.sel_col]
+                        shot = game.player_shots[game.sel_row * 10 + game.sel_col]
                         if shot == 1:
                             parts.append(f"{square}, miss")
                         elif shot == 2:
-                            ship_id = game.enemy_ship_ids[game.sel_row][game.sel_col]
-                            if ship_id in game._player_sunk_ids and ship_id > 0:
-                                ship_name = game.ship_name_from_id(ship_id)
-                                if ship_name:
-                                    parts.append(f"{square}, {ship_name}")
-                                else:
-                                    parts.append(f"{square}, hit")
-                            else:
-                                parts.append(f"{square}, hit")
+                            ship_name = game.sunk_ship_name_at(game.sel_row, game.sel_col)
+                            parts.append(f"{square}, {ship_name or 'hit'}")
                         else:
                             parts.append(square)
-            if "f3" in names and game.phase == "place":
+            if "f3" in keys and game.phase == "place":
                 parts.append("horizontal" if game.orientation == "H" else "vertical")
             if placed:
                 if before.get("phase") == "place":
-                    if before.get("place_index") != game.place_index or game.last_message == "INVALID PLACEMENT":
+                    if before.get("place_index") != game.place_index or game.last_event == "invalid":
                         parts.append(game.last_message)
                 elif before.get("phase") == "attack":
-                    prev = before.get("player_shots")
-                    if isinstance(prev, list) and self._count_marked(game.player_shots) == self._count_marked(prev):
+                    if game.shots_fired == before.get("shots_fired"):
                         parts.append(game.last_message)
         elif isinstance(game, Puzzle15):
             if moved:
@@ -1158,7 +1242,7 @@ class MainFrame(wx.Frame):
                 isinstance(game, Battleship)
                 and moved
                 and not placed
-                and "f3" not in names
+                and "f3" not in keys
             )
             if not battleship_nav_only:
                 self._set_status(msg)
@@ -1170,19 +1254,9 @@ class MainFrame(wx.Frame):
         if prev_winner is None and now_winner is not None:
             if isinstance(game, Battleship):
                 return
-            end_msg = self._game_end_message(game)
-            if end_msg:
-                self._set_status(end_msg)
-                if self.speech.enabled:
-                    self.speech.speak(end_msg, interrupt=False)
-                if "YOU WIN" in end_msg.upper():
-                    self.sound.play("win")
-                elif "YOU LOSE" in end_msg.upper():
-                    self.sound.play("lose")
-                elif "DRAW" in end_msg.upper():
-                    self.sound.play("tie")
-
-    def _play_human_sound(self, names: list[str], before: dict[str, object], game: object) -> None:
+            self._announce_game_end(game)
+
+    def _play_human_sound(self, names: Sequence[str], before: dict[str, object], game: object) -> None:
         """Play player action sounds."""
         if "f2" not in names:
             return
@@ -1192,7 +1266,7 @@ class MainFrame(wx.Frame):
             return
         if isinstance(game, Battleship) and before.get("phase") == "attack":
             prev = before.get("player_shots")
-            if isinstance(prev, list):
+            if isinstance(prev, bytes):
                 shot = self._new_shot_coord(prev, game.player_shots)
                 if shot is not None:
                     square = game._square_name(shot[0], shot[1])
@@ -1205,25 +1279,18 @@ class MainFrame(wx.Frame):
                     wx.CallLater(500, lambda: self._announce_battleship_user_shot(game, square, hit))
             return
         if isinstance(game, TicTacToe):
-            prev = before.get("board")
-            if isinstance(prev, list):
-                if self._count_token(game.board, game.player_mark) > self._count_token(prev, game.player_mark):
-                    self.sound.play("move1")
+            if game.marks_placed[game.player_mark] != before.get("player_marks"):
+                self.sound.play("move1")
             return
         if isinstance(game, Connect4):
-            prev = before.get("board")
-            if isinstance(prev, list):
-                if self._count_token(game.board, 1) > self._count_token(prev, 1):
-                    self.sound.play("move1")
+            if game.pieces_dropped[1] != before.get("player_pieces"):
+                self.sound.play("move1")
             return
         if isinstance(game, Puzzle15):
             prev = before.get("board")
             if isinstance(prev, list):
                 # A slide occurred if the board changed.
-                changed = any(
-                    game.board[r][c] != prev[r][c]
-                    for r in range(4) for c in range(4)
-                )
+                changed = game.board != prev
                 if changed:
                     self.sound.play("slide")
 
@@ -1254,16 +1321,50 @@ class MainFrame(wx.Frame):
                 return f"You win! Solved in {game.moves} moves. F3 menu."
         return ""
 
+    def _announce_game_end(self, game: object) -> None:
+        """Show, speak and play the sound for a finished game's outcome."""
+        end_msg = self._game_end_message(game)
+        if not end_msg:
+            return
+        self._set_status(end_msg)
+        if self.speech.enabled:
+            self.speech.speak(end_msg, interrupt=False)
+        sound = END_SOUNDS.get(self._game_end_event(game))
+        if sound:
+            self.sound.play(sound)
+
+    @staticmethod
+    def _game_end_event(game: object) -> str:
+        """Return "win", "lose" or "draw" for a finished game, else ""."""
+        if isinstance(game, TicTacToe):
+            if game.winner == "draw":
+                return "draw"
+            if game.winner == game.player_mark:
+                return "win"
+            if game.winner == game.ai_mark:
+                return "lose"
+        elif isinstance(game, Connect4):
+            return {-1: "draw", 1: "win", 2: "lose"}.get(game.winner, "")
+        elif isinstance(game, (Battleship, Puzzle15)):
+            return {"player": "win", "cpu": "lose"}.get(game.winner, "")
+        return ""
+
     def render_game(self) -> None:
         if not self.current_game or self.mode != "game" or self.pad is None:
             return
         game = self.current_game
+        # Build the frame here, where game state is mutated, so the writer
+        # thread only ships bytes and the next frame can be built meanwhile.
+        rows, status = game.frame()
 
         def game_job() -> None:
             # Skip stale jobs queued before mode/game changed.
             if self.mode != "game" or self.current_game is not game or self.pad is None:
                 return
-            game.render(self.pad)
+            self._menu_sent_rows = None
+            # Games send their own status line.
+            self._last_status_sent = None
+            game.send_frame(self.pad, rows, status, self._post_key_packet)
 
         self._enqueue_pad_write(game_job)
 
@@ -2,20 +2,69 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 import random
-from typing import Optional
+from typing import ClassVar, Optional
 
 import dotpad as dp
-from .utils import send_status
+from .utils import FrameRenderer
 
 
 SHIP_SIZES = [5, 4, 3, 3, 2]
 SHIP_NAMES = ["CARRIER", "BATTLESHIP", "CRUISER", "SUB", "DESTROYER"]
+# Ship names and sizes indexed directly by ship id (1-based; 0 means no ship).
+_NAME_BY_ID: tuple[str | None, ...] = (None, *SHIP_NAMES)
+_SIZE_BY_ID: tuple[int, ...] = (0, *SHIP_SIZES)
+_LOWER_NAME_BY_ID: tuple[str | None, ...] = (None, *(name.lower() for name in SHIP_NAMES))
+# Placement prompts indexed by place_index.
+_PLACE_MESSAGES: tuple[str, ...] = tuple(f"PLACE {name}" for name in SHIP_NAMES)
+
+# Square labels A1..J0 indexed r * 10 + c; column 10 is shown as 0.
+_SQUARE_NAMES: tuple[str, ...] = tuple(f"{chr(ord('A') + r)}{(c + 1) % 10}" for r in range(10) for c in range(10))
+# Flat square indexes on and off the CPU's checkerboard hunt pattern.
+_PARITY_CELLS: tuple[int, ...] = tuple(idx for idx in range(100) if (idx // 10 + idx % 10) % 2 == 0)
+_OFF_PARITY_CELLS: tuple[int, ...] = tuple(idx for idx in range(100) if (idx // 10 + idx % 10) % 2 == 1)
+# Index -> position in the pools above, copied per game for swap-and-pop removal.
+_PARITY_POS: dict[int, int] = {idx: pos for pos, idx in enumerate(_PARITY_CELLS)}
+_OFF_PARITY_POS: dict[int, int] = {idx: pos for pos, idx in enumerate(_OFF_PARITY_CELLS)}
+
+
+def _bit(r: int, c: int) -> int:
+    """Return the bitboard bit for a board square."""
+    return 1 << (r * 10 + c)
+
+
+def _ship_mask(r: int, c: int, length: int, orientation: str) -> int | None:
+    """Return the bitboard covered by a ship, or None if it runs off the board."""
+    if orientation == "H":
+        if c + length > 10:
+            return None
+        return ((1 << length) - 1) << (r * 10 + c)
+    if r + length > 10:
+        return None
+    mask = 0
+    for i in range(length):
+        mask |= _bit(r + i, c)
+    return mask
+
+
+# Every on-board placement per ship length as (orientation, row, col, mask).
+_PLACEMENT_MASKS: dict[int, tuple[tuple[str, int, int, int], ...]] = {
+    length: tuple(
+        (orientation, r, c, mask)
+        for orientation in ("H", "V")
+        for r in range(10)
+        for c in range(10)
+        if (mask := _ship_mask(r, c, length, orientation)) is not None
+    )
+    for length in set(SHIP_SIZES)
+}
 
 
 @dataclass
-class Battleship:
+class Battleship(FrameRenderer):
     """Battleship with user placement and hunt/target AI."""
 
     def __post_init__(self) -> None:
@@ -23,25 +72,57 @@ class Battleship:
 
     def reset(self) -> None:
         """Reset game state."""
-        self.player_board = [[0 for _ in range(10)] for _ in range(10)]
-        self.player_ship_ids = [[0 for _ in range(10)] for _ in range(10)]
-        self.enemy_board = [[0 for _ in range(10)] for _ in range(10)]
-        self.enemy_ship_ids = [[0 for _ in range(10)] for _ in range(10)]
-        self.player_shots = [[0 for _ in range(10)] for _ in range(10)]
-        self.enemy_shots = [[0 for _ in range(10)] for _ in range(10)]
+        # Ship, ship id and shot boards are flat row-major buffers indexed r * 10 + c.
+        self.player_board = bytearray(100)
+        self.player_ship_ids = bytearray(100)
+        self.enemy_ship_ids = bytearray(100)
+        self.player_shots = bytearray(100)
+        self.enemy_shots = bytearray(100)
+        # Bitboards (bit r * 10 + c) for ship occupancy, per-ship cells and hits.
+        self.player_mask = 0
+        self.enemy_mask = 0
+        self.player_hits = 0
+        self.enemy_hits = 0
+        self._player_ship_masks: dict[int, int] = {}
+        self._enemy_ship_masks: dict[int, int] = {}
+        # Cells of each placed ship, bow to stern, keyed by ship id.
+        self._player_ship_cells: dict[int, tuple[tuple[int, int], ...]] = {}
+        self._enemy_ship_cells: dict[int, tuple[tuple[int, int], ...]] = {}
+        # Unhit ship cells left on each side; zero means that fleet is sunk.
+        self._enemy_remaining = sum(SHIP_SIZES)
+        self._player_remaining = sum(SHIP_SIZES)
         self.place_index = 0
         self.orientation = "H"
         self.sel_row = 0
         self.sel_col = 0
         self.phase = "place"
         self.winner: Optional[str] = None
-        self.last_message = f"PLACE {SHIP_NAMES[0]}"
-        self.last_message_braille = f"PLACE {SHIP_NAMES[0]}"
+        self.shots_fired = 0
+        # Outcome of the player's latest action: "placed", "invalid",
+        # "duplicate", "hit" or "miss"; empty before the first one. The game
+        # result lives in winner.
+        self.last_event = ""
+        self.last_message = _PLACE_MESSAGES[0]
+        self.last_message_braille = _PLACE_MESSAGES[0]
         self._last_rows: list[bytes] | None = None
+        self._last_status: str | None = None
+        # Cached label and grid layer plus the squares and ships drawn since.
+        self._board_cells: list[int] | None = None
+        self._board_phase: str | None = None
+        self._dirty_cells: set[tuple[int, int]] = set()
+        self._dirty_ships: list[tuple[tuple[int, int], ...]] = []
         self._place_enemy_ships()
-        self._target_queue: list[tuple[int, int]] = []
+        self._target_queue: deque[tuple[int, int]] = deque()
+        # Unshot CPU squares (flat index), split by checkerboard parity, with
+        # index -> position maps so a shot removes its square by swap-and-pop.
+        self._cpu_parity: list[int] = list(_PARITY_CELLS)
+        self._cpu_parity_pos: dict[int, int] = _PARITY_POS.copy()
+        self._cpu_other: list[int] = list(_OFF_PARITY_CELLS)
+        self._cpu_other_pos: dict[int, int] = _OFF_PARITY_POS.copy()
         self._target_set: set[tuple[int, int]] = set()
         self._player_sunk_ids: set[int] = set()
+        # Bitboard of enemy ship cells belonging to ships the player has sunk.
+        self._sunk_cells_mask = 0
         self._cpu_sunk_ids: set[int] = set()
         self.pending_user_sunk_speech: str | None = None
 
@@ -70,10 +151,12 @@ class Battleship:
                 self._fire()
 
     def _place_ship(self) -> None:
-        ship_idx = self.place_index
-        length = SHIP_SIZES[ship_idx]
-        ship_name = SHIP_NAMES[ship_idx].lower()
-        if not self._can_place(self.player_board, self.sel_row, self.sel_col, length, self.orientation):
+        ship_id = self.place_index + 1
+        length = _SIZE_BY_ID[ship_id]
+        ship_name = _LOWER_NAME_BY_ID[ship_id]
+        mask = _ship_mask(self.sel_row, self.sel_col, length, self.orientation)
+        if mask is None or mask & self.player_mask:
+            self.last_event = "invalid"
             self.last_message = "INVALID PLACEMENT"
             self.last_message_braille = "INVALID PLACEMENT"
             return
@@ -82,9 +165,16 @@ class Battleship:
         end_col = self.sel_col + (length - 1 if self.orientation == "H" else 0)
         end = self._square_name(end_row, end_col)
         self._do_place(self.player_board, self.sel_row, self.sel_col, length, self.orientation)
-        ship_id = ship_idx + 1
-        self._do_place_id(self.player_ship_ids, self.sel_row, self.sel_col, length, self.orientation, ship_id)
+        self.player_mask |= mask
+        self._player_ship_masks[ship_id] = mask
+        cells = self._do_place_id(
+            self.player_ship_ids, self.sel_row, self.sel_col, length, self.orientation, ship_id
+        )
+        self._player_ship_cells[ship_id] = cells
+        self._dirty_cells.update(cells)
+        self._dirty_ships.append(cells)
         self.place_index += 1
+        self.last_event = "placed"
         self.last_message = f"placed {ship_name} from {start} to {end}"
         self.last_message_braille = self.last_message
         self.last_message_braille = f"placed {ship_name}"
@@ -95,27 +185,37 @@ class Battleship:
 
     def _fire(self) -> None:
         self.pending_user_sunk_speech = None
-        if self.player_shots[self.sel_row][self.sel_col] != 0:
+        if self.player_shots[self.sel_row * 10 + self.sel_col]:
+            self.last_event = "duplicate"
             self.last_message = "ALREADY FIRED"
             self.last_message_braille = "ALREADY FIRED"
             return
-        hit = self.enemy_board[self.sel_row][self.sel_col] == 1
-        self.player_shots[self.sel_row][self.sel_col] = 2 if hit else 1
+        self.shots_fired += 1
+        bit = _bit(self.sel_row, self.sel_col)
+        hit = bool(self.enemy_mask & bit)
+        self.last_event = "hit" if hit else "miss"
+        if hit:
+            self.player_hits |= bit
+            self._enemy_remaining -= 1
+        self.player_shots[self.sel_row * 10 + self.sel_col] = 2 if hit else 1
+        self._dirty_cells.add((self.sel_row, self.sel_col))
         user_square = self._square_name(self.sel_row, self.sel_col)
         user_part = f"you hit {user_square}" if hit else f"you miss {user_square}"
         user_part_braille = f"y hit {user_square}" if hit else f"y miss {user_square}"
         sunk_parts: list[str] = []
         sunk_parts_braille: list[str] = []
         if hit:
-            ship_id = self.enemy_ship_ids[self.sel_row][self.sel_col]
-            if ship_id > 0 and self._is_ship_sunk(self.enemy_ship_ids, self.player_shots, ship_id):
+            ship_id = self.enemy_ship_ids[self.sel_row * 10 + self.sel_col]
+            if ship_id > 0 and self._is_ship_sunk(self._enemy_ship_masks[ship_id], self.player_hits):
                 if ship_id not in self._player_sunk_ids:
                     self._player_sunk_ids.add(ship_id)
-                    sunk = f"you sunk {SHIP_NAMES[ship_id - 1].lower()}"
+                    self._sunk_cells_mask |= self._enemy_ship_masks[ship_id]
+                    self._dirty_ships.append(self._enemy_ship_cells[ship_id])
+                    sunk = f"you sunk {_LOWER_NAME_BY_ID[ship_id]}"
                     sunk_parts.append(sunk)
                     sunk_parts_braille.append(sunk.replace("you", "y"))
                     self.pending_user_sunk_speech = sunk
-        if self._all_sunk(self.enemy_board, self.player_shots):
+        if self._enemy_remaining == 0:
             self.winner = "player"
             self.last_message = f"{user_part}, you win"
             self.last_message_braille = f"{user_part_braille} y win"
@@ -132,7 +232,7 @@ class Battleship:
         sunk_parts: list[str] = []
         sunk_parts_braille: list[str] = []
         if cpu_sunk_name:
-            sunk = f"I sunk {cpu_sunk_name.lower()}"
+            sunk = f"I sunk {cpu_sunk_name}"
             sunk_parts.append(sunk)
             sunk_parts_braille.append(sunk)
 
@@ -149,52 +249,68 @@ class Battleship:
 
     def _enemy_turn(self) -> tuple[bool, str, str | None]:
         r, c = self._enemy_pick()
-        hit = self.player_board[r][c] == 1
-        self.enemy_shots[r][c] = 2 if hit else 1
+        idx = r * 10 + c
+        if (r + c) % 2 == 0:
+            self._swap_remove(self._cpu_parity, self._cpu_parity_pos, idx)
+        else:
+            self._swap_remove(self._cpu_other, self._cpu_other_pos, idx)
+        bit = _bit(r, c)
+        hit = bool(self.player_mask & bit)
+        if hit:
+            self.enemy_hits |= bit
+            self._player_remaining -= 1
+        self.enemy_shots[r * 10 + c] = 2 if hit else 1
         sunk_name: str | None = None
         if hit:
-            ship_id = self.player_ship_ids[r][c]
+            ship_id = self.player_ship_ids[r * 10 + c]
             self._enqueue_from_hit_cluster(r, c)
-            if ship_id > 0 and self._is_ship_sunk(self.player_ship_ids, self.enemy_shots, ship_id):
+            if ship_id > 0 and self._is_ship_sunk(self._player_ship_masks[ship_id], self.enemy_hits):
                 if ship_id not in self._cpu_sunk_ids:
                     self._cpu_sunk_ids.add(ship_id)
-                    sunk_name = SHIP_NAMES[ship_id - 1]
+                    sunk_name = _LOWER_NAME_BY_ID[ship_id]
                 # Reset targeting after a sink so we return to hunt mode cleanly.
                 self._target_queue.clear()
                 self._target_set.clear()
-        if self._all_sunk(self.player_board, self.enemy_shots):
+        if self._player_remaining == 0:
             self.winner = "cpu"
         return hit, self._square_name(r, c), sunk_name
 
     @staticmethod
     def _square_name(r: int, c: int) -> str:
         """Return board square label like A1..J0 (10 rendered as 0)."""
-        col_num = c + 1
-        col_label = "0" if col_num == 10 else str(col_num)
-        return f"{chr(ord('A') + r)}{col_label}"
+        return _SQUARE_NAMES[r * 10 + c]
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _fit_message(msg: str, limit: int = 20) -> str:
         """Normalize gameplay text for the graphics message line."""
         return msg.strip().upper()[:limit]
 
     def _enemy_pick(self) -> tuple[int, int]:
         while self._target_queue:
-            r, c = self._target_queue.pop(0)
+            r, c = self._target_queue.popleft()
             self._target_set.discard((r, c))
-            if self.enemy_shots[r][c] == 0:
+            if self.enemy_shots[r * 10 + c] == 0:
                 return r, c
         # Hunt on parity squares first for better ship coverage.
-        parity = [(r, c) for r in range(10) for c in range(10) if self.enemy_shots[r][c] == 0 and (r + c) % 2 == 0]
-        if parity:
-            return random.choice(parity)
-        options = [(r, c) for r in range(10) for c in range(10) if self.enemy_shots[r][c] == 0]
-        return random.choice(options)
+        cells = self._cpu_parity or self._cpu_other
+        return divmod(cells[random.randrange(len(cells))], 10)
+
+    @staticmethod
+    def _swap_remove(cells: list[int], positions: dict[int, int], idx: int) -> None:
+        """Drop idx from an unordered cell list in O(1), keeping positions in sync."""
+        pos = positions.pop(idx, None)
+        if pos is None:
+            return
+        last = cells.pop()
+        if last != idx:
+            cells[pos] = last
+            positions[last] = pos
 
     def _enqueue_target(self, r: int, c: int) -> None:
         if not (0 <= r < 10 and 0 <= c < 10):
             return
-        if self.enemy_shots[r][c] != 0:
+        if self.enemy_shots[r * 10 + c] != 0:
             return
         key = (r, c)
         if key in self._target_set:
@@ -231,7 +347,7 @@ class Battleship:
         """Return orthogonally connected enemy hit cells around (r, c)."""
         if not (0 <= r < 10 and 0 <= c < 10):
             return []
-        if self.enemy_shots[r][c] != 2:
+        if self.enemy_shots[r * 10 + c] != 2:
             return []
         out: list[tuple[int, int]] = []
         stack = [(r, c)]
@@ -244,104 +360,96 @@ class Battleship:
                 key = (nr, nc)
                 if key in seen:
                     continue
-                if 0 <= nr < 10 and 0 <= nc < 10 and self.enemy_shots[nr][nc] == 2:
+                if 0 <= nr < 10 and 0 <= nc < 10 and self.enemy_shots[nr * 10 + nc] == 2:
                     seen.add(key)
                     stack.append(key)
         return out
 
-    def _all_sunk(self, ships: list[list[int]], shots: list[list[int]]) -> bool:
-        for r in range(10):
-            for c in range(10):
-                if ships[r][c] == 1 and shots[r][c] != 2:
-                    return False
-        return True
-
     @staticmethod
-    def _is_ship_sunk(ship_ids: list[list[int]], shots: list[list[int]], ship_id: int) -> bool:
-        """Return True when all cells for ship_id have been hit."""
-        for r in range(10):
-            for c in range(10):
-                if ship_ids[r][c] == ship_id and shots[r][c] != 2:
-                    return False
-        return True
+    def _is_ship_sunk(ship_mask: int, hits: int) -> bool:
+        """Return True when all cells of one ship's bitboard have been hit."""
+        return ship_mask & hits == ship_mask
 
     def _place_enemy_ships(self) -> None:
-        for idx, length in enumerate(SHIP_SIZES):
-            placed = False
-            while not placed:
-                orientation = random.choice(["H", "V"])
-                r = random.randrange(10)
-                c = random.randrange(10)
-                if self._can_place(self.enemy_board, r, c, length, orientation):
-                    self._do_place(self.enemy_board, r, c, length, orientation)
-                    self._do_place_id(self.enemy_ship_ids, r, c, length, orientation, idx + 1)
-                    placed = True
-
-    def _can_place(self, board: list[list[int]], r: int, c: int, length: int, orientation: str) -> bool:
-        if orientation == "H":
-            if c + length > 10:
-                return False
-            return all(board[r][c + i] == 0 for i in range(length))
-        if r + length > 10:
-            return False
-        return all(board[r + i][c] == 0 for i in range(length))
-
-    def _do_place(self, board: list[list[int]], r: int, c: int, length: int, orientation: str) -> None:
+        """Place the CPU fleet, drawing each ship from its still-open placements."""
+        while True:
+            masks: dict[int, tuple[str, int, int, int]] = {}
+            occupied = 0
+            for ship_id in range(1, len(_SIZE_BY_ID)):
+                candidates = [cand for cand in _PLACEMENT_MASKS[_SIZE_BY_ID[ship_id]] if not cand[3] & occupied]
+                if not candidates:
+                    # Boxed in by earlier ships; start the fleet over.
+                    break
+                placement = candidates[random.randrange(len(candidates))]
+                masks[ship_id] = placement
+                occupied |= placement[3]
+            else:
+                break
+        for ship_id, (orientation, r, c, mask) in masks.items():
+            length = _SIZE_BY_ID[ship_id]
+            self.enemy_mask |= mask
+            self._enemy_ship_masks[ship_id] = mask
+            self._enemy_ship_cells[ship_id] = self._do_place_id(
+                self.enemy_ship_ids, r, c, length, orientation, ship_id
+            )
+
+    def _do_place(self, board: bytearray, r: int, c: int, length: int, orientation: str) -> None:
+        start = r * 10 + c
         if orientation == "H":
-            for i in range(length):
-                board[r][c + i] = 1
+            board[start:start + length] = b"\x01" * length
         else:
-            for i in range(length):
-                board[r + i][c] = 1
+            board[start:start + length * 10:10] = b"\x01" * length
 
     def _do_place_id(
         self,
-        board: list[list[int]],
+        board: bytearray,
         r: int,
         c: int,
         length: int,
         orientation: str,
         ship_id: int,
-    ) -> None:
-        """Mark placed ship segments with a stable ship id."""
+    ) -> tuple[tuple[int, int], ...]:
+        """Mark placed ship segments with a stable ship id; return their cells in order."""
+        start = r * 10 + c
         if orientation == "H":
-            for i in range(length):
-                board[r][c + i] = ship_id
-        else:
-            for i in range(length):
-                board[r + i][c] = ship_id
+            board[start:start + length] = bytes((ship_id,)) * length
+            return tuple((r, c + i) for i in range(length))
+        board[start:start + length * 10:10] = bytes((ship_id,)) * length
+        return tuple((r + i, c) for i in range(length))
 
     def ship_name_at(self, row: int, col: int) -> str | None:
         """Return ship name at player board coordinate, if any."""
         if not (0 <= row < 10 and 0 <= col < 10):
             return None
-        ship_id = self.player_ship_ids[row][col]
-        if ship_id <= 0:
+        return self.ship_name_from_id(self.player_ship_ids[row * 10 + col])
+
+    def sunk_ship_name_at(self, row: int, col: int) -> str | None:
+        """Return enemy ship name at a coordinate once the player has sunk it."""
+        if not self._sunk_cells_mask & _bit(row, col):
             return None
-        idx = ship_id - 1
-        if 0 <= idx < len(SHIP_NAMES):
-            return SHIP_NAMES[idx]
-        return None
+        return self.ship_name_from_id(self.enemy_ship_ids[row * 10 + col])
 
     @staticmethod
     def ship_name_from_id(ship_id: int) -> str | None:
         """Return canonical ship name for a ship id."""
-        idx = ship_id - 1
-        if 0 <= idx < len(SHIP_NAMES):
-            return SHIP_NAMES[idx]
-        return None
-
-    def render(self, pad: dp.DotPad) -> None:
-        """Render the current game state to the DotPad.
-
-        Args:
-            pad: DotPad instance.
-        """
-        builder = pad.builder()
-
-        top = 6
-        left = 5
-        step = 3
+        return _NAME_BY_ID[ship_id] if 0 < ship_id < len(_NAME_BY_ID) else None
+
+    # Grid layout constants (dot coordinates, 1-indexed)
+    _TOP = 6
+    _LEFT = 5
+    _STEP = 3
+    # Cells of the label layer, shared by every game once first drawn.
+    _label_cells: ClassVar[list[int] | None] = None
+
+    @classmethod
+    def _draw_labels(cls, builder: dp.DotPadBuilder) -> None:
+        """Draw the column numbers and mirrored row letters onto an empty builder."""
+        if cls._label_cells is not None:
+            builder.buffer.cells[:] = cls._label_cells
+            return
+        top = cls._TOP
+        left = cls._LEFT
+        step = cls._STEP
 
         # Column numbers with one number sign, placed one cell left of "1".
         builder.render_text_dots("3456", row=2, col=max(1, left - 3))
@@ -359,42 +467,68 @@ class Battleship:
             # Mirror row label at right edge for faster orientation.
             right_col = left + (10 * step) + 1
             builder.render_text(letter, row=row, col=right_col)
+        cls._label_cells = builder.buffer.cells[:]
 
-        # Grid contents
+    def _draw_grid_cell(self, builder: dp.DotPadBuilder, r: int, c: int) -> None:
+        """Draw the ship or shot mark for one square of the current view."""
+        dot_row = self._TOP + r * self._STEP
+        dot_col = self._LEFT + c * self._STEP
+        idx = r * 10 + c
         if self.phase == "place":
-            view_board = self.player_board
-            view_shots = None
+            if self.player_board[idx] == 1:
+                builder.draw_line(dot_row, dot_col, 2)
+                builder.draw_line(dot_row + 1, dot_col, 2)
+            return
+        shot = self.player_shots[idx]
+        if shot == 1:
+            builder.render_text_dots("1", row=dot_row, col=dot_col)
+        elif shot == 2:
+            # Show hit ship cells with the same ship glyph style.
+            builder.draw_line(dot_row, dot_col, 2)
+            builder.draw_line(dot_row + 1, dot_col, 2)
+
+    def _draw_connectors(self, builder: dp.DotPadBuilder, cells: tuple[tuple[int, int], ...]) -> None:
+        """Connect adjacent segments of one ship with a single dot."""
+        for (r, c), (next_r, _next_c) in zip(cells, cells[1:]):
+            dot_row = self._TOP + r * self._STEP
+            dot_col = self._LEFT + c * self._STEP
+            if next_r == r:
+                builder.render_text_dots("1", row=dot_row + 1, col=dot_col + 2)
+            else:
+                builder.render_text_dots("1", row=dot_row + 2, col=dot_col + 1)
+
+    def frame(self) -> tuple[list[bytes], str]:
+        """Build the display rows and status line for the current game state."""
+        builder = dp.DotPadBuilder.empty()
+
+        top = self._TOP
+        left = self._LEFT
+        step = self._STEP
+
+        # Labels and grid marks only gain dots within a phase, so keep that
+        # layer between frames and draw just the cells changed since.
+        if self._board_cells is None or self._board_phase != self.phase:
+            self._draw_labels(builder)
+            view = self.player_board if self.phase == "place" else self.player_shots
+            draw_cell = self._draw_grid_cell
+            for idx, value in enumerate(view):
+                if value:
+                    draw_cell(builder, *divmod(idx, 10))
+            if self.phase == "place":
+                connected = list(self._player_ship_cells.values())
+            else:
+                connected = [self._enemy_ship_cells[ship_id] for ship_id in self._player_sunk_ids]
+            self._board_phase = self.phase
         else:
-            view_board = self.enemy_board
-            view_shots = self.player_shots
-
-        for r in range(10):
-            for c in range(10):
-                dot_row = top + r * step
-                dot_col = left + c * step
-                if self.phase == "place" and view_board[r][c] == 1:
-                    builder.draw_line(dot_row, dot_col, 2)
-                    builder.draw_line(dot_row + 1, dot_col, 2)
-                    # Connect adjacent ship segments with a single dot.
-                    cur_id = self.player_ship_ids[r][c]
-                    if c < 9 and cur_id != 0 and self.player_ship_ids[r][c + 1] == cur_id:
-                        builder.render_text_dots("1", row=dot_row + 1, col=dot_col + 2)
-                    if r < 9 and cur_id != 0 and self.player_ship_ids[r + 1][c] == cur_id:
-                        builder.render_text_dots("1", row=dot_row + 2, col=dot_col + 1)
-                if view_shots:
-                    if view_shots[r][c] == 1:
-                        builder.render_text_dots("1", row=dot_row, col=dot_col)
-                    elif view_shots[r][c] == 2:
-                        # Show hit ship cells with the same ship glyph style.
-                        builder.draw_line(dot_row, dot_col, 2)
-                        builder.draw_line(dot_row + 1, dot_col, 2)
-                        ship_id = self.enemy_ship_ids[r][c]
-                        # Connect only after this enemy ship is sunk.
-                        if ship_id in self._player_sunk_ids:
-                            if c < 9 and self.enemy_ship_ids[r][c + 1] == ship_id:
-                                builder.render_text_dots("1", row=dot_row + 1, col=dot_col + 2)
-                            if r < 9 and self.enemy_ship_ids[r + 1][c] == ship_id:
-                                builder.render_text_dots("1", row=dot_row + 2, col=dot_col + 1)
+            builder.buffer.cells[:] = self._board_cells
+            for r, c in self._dirty_cells:
+                self._draw_grid_cell(builder, r, c)
+            connected = self._dirty_ships
+        for cells in connected:
+            self._draw_connectors(builder, cells)
+        self._board_cells = builder.buffer.cells[:]
+        self._dirty_cells.clear()
+        self._dirty_ships = []
 
         # Cursor while game is active.
         if self.winner is None:
@@ -426,8 +560,7 @@ class Battleship:
         # Extra in-graphics status line at the bottom.
         msg = self.last_message_braille
         if self.phase == "place" and (not msg or msg.startswith("PLACE")):
-            current = SHIP_NAMES[min(self.place_index, len(SHIP_NAMES) - 1)]
-            msg = f"PLACE {current}"
+            msg = _PLACE_MESSAGES[min(self.place_index, len(_PLACE_MESSAGES) - 1)]
         builder.render_text(
             self._fit_message(msg),
             row=38,
@@ -436,21 +569,13 @@ class Battleship:
             use_nemeth=True,
         )
 
-        rows = builder.rows()
-        if self._last_rows is None:
-            for i, row_bytes in enumerate(rows, start=1):
-                pad.send_display_line(i, row_bytes)
-        else:
-            for i, row_bytes in enumerate(rows, start=1):
-                if row_bytes != self._last_rows[i - 1]:
-                    pad.send_display_line(i, row_bytes)
-        self._last_rows = rows
-
         if self.winner == "player":
-            send_status(pad, "YOU WIN F3 MENU")
+            status = "YOU WIN F3 MENU"
         elif self.winner == "cpu":
-            send_status(pad, "YOU LOSE F3 MENU")
+            status = "YOU LOSE F3 MENU"
         elif self.phase == "place":
-            send_status(pad, "PAN/F1/F4 MV F2 PLC")
+            status = "PAN/F1/F4 MV F2 PLC"
         else:
-            send_status(pad, "PAN/F1/F4 MV F2 FIR")
+            status = "PAN/F1/F4 MV F2 FIR"
+
+        return builder.rows(), status
@@ -3,29 +3,139 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import math
-from typing import Optional
+from typing import ClassVar, Optional
 
 import dotpad as dp
-from .utils import send_status
+from .utils import FrameRenderer, glyph_cells, stamp_cells
+
+
+def _window_score(ai: int, human: int) -> int:
+    """Score one four-cell window holding the given piece counts."""
+    empty = 4 - ai - human
+    if ai == 4:
+        return 100_000
+    if ai == 3 and empty == 1:
+        return 120
+    if ai == 2 and empty == 2:
+        return 15
+    if human == 4:
+        return -100_000
+    if human == 3 and empty == 1:
+        return -140
+    if human == 2 and empty == 2:
+        return -10
+    return 0
+
+
+# Transposition-table entry flags: exact value, lower bound, upper bound.
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+# Entries kept before the table is cleared mid-search.
+_TT_MAX_ENTRIES = 20_000
+
+# Window scores indexed ai pieces * 5 + human pieces.
+_WINDOW_SCORES = tuple(_window_score(ai, human) for ai in range(5) for human in range(5))
+
+
+def _has_four(bb: int, shifts: tuple[int, ...]) -> bool:
+    """Return True if a player bitboard holds four in a row along any shift."""
+    for shift in shifts:
+        pairs = bb & (bb >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+def _win_cells(bb: int, shifts: tuple[int, ...]) -> int:
+    """Return the cells that would complete four in a row for a player bitboard.
+
+    Includes cells off the board or already taken; callers mask the result.
+    """
+    cells = 0
+    for shift in shifts:
+        # Two pieces just below the cell along this line, then a third beyond
+        # them or one just above the cell.
+        below = (bb << shift) & (bb << (2 * shift))
+        cells |= below & ((bb << (3 * shift)) | (bb >> shift))
+        above = (bb >> shift) & (bb >> (2 * shift))
+        cells |= above & ((bb >> (3 * shift)) | (bb << shift))
+    return cells
+
+
+@lru_cache(maxsize=8)
+def _board_layout(rows: int, cols: int) -> tuple[tuple[tuple[int, int], ...], tuple[int, ...]]:
+    """Return the search move order and four-cell line masks for a board size.
+
+    The move order lists columns center out, each paired with its first
+    out-of-board height bit.
+    """
+    height = rows + 1
+    center = cols // 2
+    order = sorted(range(cols), key=lambda col: (abs(col - center), col))
+    move_order = tuple((col, col * height + rows) for col in order)
+    lines: list[tuple[int, int]] = []
+    for c in range(cols):
+        for h in range(rows):
+            start = c * height + h
+            # Vertical, horizontal, and both diagonals from this cell.
+            if h + 3 < rows:
+                lines.append((start, 1))
+            if c + 3 < cols:
+                lines.append((start, height))
+                if h + 3 < rows:
+                    lines.append((start, height + 1))
+                if h >= 3:
+                    lines.append((start, height - 1))
+    windows = tuple(sum(1 << (start + i * step) for i in range(4)) for start, step in lines)
+    return move_order, windows
 
 
 @dataclass
-class Connect4:
+class Connect4(FrameRenderer):
     """Connect 4 game with alpha-beta minimax AI."""
 
     cols: int = 7
     rows: int = 6
 
+    # Drawn piece cells keyed by (player, row, col), shared by every game.
+    _glyphs: ClassVar[dict[tuple[int, int, int], tuple[tuple[int, int], ...]]] = {}
+
     def __post_init__(self) -> None:
         self.reset()
 
     def reset(self) -> None:
         """Reset the game state."""
-        self.board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        # Display view of committed moves; the AI searches on the bitboards.
+        self.board = [[0] * self.cols for _ in range(self.rows)]
+        # Bitboards per player (index 0 human, 1 AI). Each column takes
+        # rows + 1 bits, bottom row first, with a spare sentinel bit on top so
+        # lines cannot wrap between columns.
+        height = self.rows + 1
+        self._bb = [0, 0]
+        self._col_base = tuple(col * height for col in range(self.cols))
+        self._heights = list(self._col_base)
+        self._full = sum(((1 << self.rows) - 1) << base for base in self._col_base)
+        self._bottom = sum(1 << base for base in self._col_base)
+        self._center_mask = ((1 << self.rows) - 1) << self._col_base[self.cols // 2]
+        # Vertical, horizontal and both diagonal steps in bit positions.
+        self._shifts = (1, height, height - 1, height + 1)
+        self._move_order, self._windows = _board_layout(self.rows, self.cols)
+        # Search results keyed by (human bitboard, AI bitboard), kept for one
+        # AI move so the table stays small.
+        self._tt: dict[tuple[int, int], tuple[int, int, float, int]] = {}
         self.sel_col = 3
         self.winner: Optional[int] = None
+        # Pieces dropped per player (index 1 human, 2 AI); search drops are not counted.
+        self.pieces_dropped = [0, 0, 0]
         self._last_rows: list[bytes] | None = None
+        self._last_status: str | None = None
+        # Last frame() result and the state it was built from.
+        self._frame_key: tuple | None = None
+        self._last_frame: tuple[list[bytes], str] | None = None
+        # Cached cells of the piece layer plus the pieces dropped since.
+        self._piece_cells: list[int] | None = None
+        self._dirty_pieces: list[tuple[int, int]] = []
 
     def handle_key(self, names: list[str]) -> None:
         """Handle DotPad key inputs.
@@ -41,7 +151,8 @@ class Connect4:
             self.sel_col = (self.sel_col + 1) % self.cols
         if "f2" in names:
             if self._drop(self.sel_col, 1):
-                self._check_winner()
+                self.pieces_dropped[1] += 1
+                self._check_winner(1)
 
     def run_ai_turn(self) -> bool:
         """Run one AI turn if game is still active."""
@@ -51,44 +162,29 @@ class Connect4:
         return True
 
     def _drop(self, col: int, player: int) -> bool:
-        for r in reversed(range(self.rows)):
-            if self.board[r][col] == 0:
-                self.board[r][col] = player
-                return True
-        return False
-
-    def _check_winner(self) -> None:
-        win = self._find_winner()
-        if win:
-            self.winner = win
-        elif all(self.board[0][c] != 0 for c in range(self.cols)):
-            self.winner = -1
+        """Commit a move to both the bitboards and the display board."""
+        if not self._can_drop(col):
+            return False
+        row = self.rows - 1 - (self._heights[col] - self._col_base[col])
+        self.board[row][col] = player
+        self._dirty_pieces.append((row, col))
+        self._push(col, player)
+        return True
 
-    def _find_winner(self) -> Optional[int]:
-        for r in range(self.rows):
-            for c in range(self.cols):
-                player = self.board[r][c]
-                if player == 0:
-                    continue
-                if self._check_dir(r, c, 1, 0, player):
-                    return player
-                if self._check_dir(r, c, 0, 1, player):
-                    return player
-                if self._check_dir(r, c, 1, 1, player):
-                    return player
-                if self._check_dir(r, c, 1, -1, player):
-                    return player
-        return None
+    def _push(self, col: int, player: int) -> None:
+        """Drop a piece on the bitboards only (search moves)."""
+        self._bb[player - 1] |= 1 << self._heights[col]
+        self._heights[col] += 1
 
-    def _check_dir(self, r: int, c: int, dr: int, dc: int, player: int) -> bool:
-        for i in range(4):
-            rr = r + dr * i
-            cc = c + dc * i
-            if rr < 0 or rr >= self.rows or cc < 0 or cc >= self.cols:
-                return False
-            if self.board[rr][cc] != player:
-                return False
-        return True
+    def _check_winner(self, player: int) -> None:
+        """Update winner after player's drop; only that player can have just won."""
+        if _has_four(self._bb[player - 1], self._shifts):
+            self.winner = player
+        elif self._board_full():
+            self.winner = -1
+
+    def _board_full(self) -> bool:
+        return self._bb[0] | self._bb[1] == self._full
 
     def _ai_move(self) -> None:
         valid = self._valid_moves()
@@ -96,129 +192,182 @@ class Connect4:
             self.winner = -1
             return
 
+        # An immediate win, or the only block of an immediate loss, needs no search.
+        forced = self._forced_column()
+        if forced is not None:
+            self._drop(forced, 2)
+            self.pieces_dropped[2] += 1
+            self._check_winner(2)
+            return
+
+        self._tt.clear()
         # Deeper search late-game when branching is smaller.
-        empties = sum(1 for r in range(self.rows) for c in range(self.cols) if self.board[r][c] == 0)
+        empties = self.rows * self.cols - (self._bb[0] | self._bb[1]).bit_count()
         depth = 6 if empties <= 20 else 5
 
+        # Iterative deepening: each pass searches root moves in the order of
+        # the previous pass's scores, so the likely best move sets alpha first.
         best_col = valid[0]
-        best_score = -math.inf
-        alpha = -math.inf
-        beta = math.inf
-        for col in valid:
-            self._drop(col, 2)
-            score = self._minimax(depth - 1, maximizing=False, alpha=alpha, beta=beta)
-            self._undo_drop(col)
-            if score > best_score:
-                best_score = score
-                best_col = col
-            alpha = max(alpha, best_score)
-            if beta <= alpha:
+        order = valid
+        for search_depth in range(1, depth + 1):
+            scores: dict[int, float] = {}
+            best_score = -math.inf
+            alpha = -math.inf
+            for col in order:
+                self._push(col, 2)
+                score = self._minimax(search_depth - 1, maximizing=False, alpha=alpha, beta=math.inf)
+                self._undo_drop(col)
+                scores[col] = score
+                if score > best_score:
+                    best_score = score
+                    best_col = col
+                alpha = max(alpha, best_score)
+            if best_score >= 1_000_000:
+                # Forced win found; deeper passes cannot improve on it.
                 break
+            order = sorted(order, key=scores.__getitem__, reverse=True)
 
         self._drop(best_col, 2)
-        self._check_winner()
+        self.pieces_dropped[2] += 1
+        self._check_winner(2)
+
+    def _forced_column(self) -> Optional[int]:
+        """Return the AI's winning drop, else the one drop that stops a human win."""
+        bb_human, bb_ai = self._bb
+        # Adding each column's bottom bit carries into its lowest empty cell.
+        playable = ((bb_human | bb_ai) + self._bottom) & self._full
+        cells = playable & _win_cells(bb_ai, self._shifts)
+        if not cells:
+            cells = playable & _win_cells(bb_human, self._shifts)
+            # Two or more threats cannot all be blocked; let the search pick.
+            if not cells or cells & (cells - 1):
+                return None
+        heights = self._heights
+        for col, _top in self._move_order:
+            if cells >> heights[col] & 1:
+                return col
+        return None
 
     def _can_drop(self, col: int) -> bool:
-        return self.board[0][col] == 0
+        return self._heights[col] - self._col_base[col] < self.rows
 
     def _undo_drop(self, col: int) -> None:
-        for r in range(self.rows):
-            if self.board[r][col] != 0:
-                self.board[r][col] = 0
-                return
+        """Take back the top search piece in a column."""
+        self._heights[col] -= 1
+        keep = ~(1 << self._heights[col])
+        self._bb[0] &= keep
+        self._bb[1] &= keep
 
     def _valid_moves(self) -> list[int]:
         """Return drop columns ordered from center out."""
-        center = self.cols // 2
-        order = [center]
-        for i in range(1, self.cols):
-            if center - i >= 0:
-                order.append(center - i)
-            if center + i < self.cols:
-                order.append(center + i)
-        return [c for c in order if self._can_drop(c)]
+        heights = self._heights
+        return [col for col, top in self._move_order if heights[col] < top]
 
     def _minimax(self, depth: int, maximizing: bool, alpha: float, beta: float) -> float:
-        winner = self._find_winner()
-        if winner == 2:
+        # Searched positions start without a winner, so only the side that just
+        # moved can have completed a line.
+        if maximizing:
+            if _has_four(self._bb[0], self._shifts):
+                return -1_000_000 - depth
+        elif _has_four(self._bb[1], self._shifts):
             return 1_000_000 + depth
-        if winner == 1:
-            return -1_000_000 - depth
-        if all(self.board[0][c] != 0 for c in range(self.cols)):
+        if self._board_full():
             return 0
         if depth <= 0:
             return self._evaluate_position()
 
-        valid = self._valid_moves()
+        bb = self._bb
+        key = (bb[0], bb[1])
+        entry = self._tt.get(key)
+        hint = -1
+        if entry is not None:
+            stored_depth, flag, stored, hint = entry
+            # The stored best move is tried first even when its depth differs.
+            if stored_depth == depth:
+                if flag == _EXACT:
+                    return stored
+                if flag == _LOWER:
+                    if stored > alpha:
+                        alpha = stored
+                elif stored < beta:
+                    beta = stored
+                if beta <= alpha:
+                    return stored
+        alpha_orig = alpha
+        beta_orig = beta
+        value, best_col = self._search_moves(depth, maximizing, alpha, beta, hint)
+        if value <= alpha_orig:
+            flag = _UPPER
+        elif value >= beta_orig:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        if len(self._tt) >= _TT_MAX_ENTRIES:
+            self._tt.clear()
+        self._tt[key] = (depth, flag, value, best_col)
+        return value
+
+    def _search_moves(
+        self, depth: int, maximizing: bool, alpha: float, beta: float, hint: int
+    ) -> tuple[float, int]:
+        """Alpha-beta over the child moves of the current search position.
+
+        Returns the node value and the move that produced it. A valid hint
+        column is searched first.
+        """
+        moves = self._valid_moves()
+        if hint in moves:
+            moves.remove(hint)
+            moves.insert(0, hint)
+        best_col = moves[0]
+        # Moves are applied inline on local references; this is the hottest
+        # loop in the game.
+        bb = self._bb
+        heights = self._heights
         if maximizing:
             value = -math.inf
-            for col in valid:
-                self._drop(col, 2)
-                value = max(value, self._minimax(depth - 1, False, alpha, beta))
-                self._undo_drop(col)
-                alpha = max(alpha, value)
+            for col in moves:
+                bit = 1 << heights[col]
+                heights[col] += 1
+                bb[1] |= bit
+                score = self._minimax(depth - 1, False, alpha, beta)
+                bb[1] ^= bit
+                heights[col] -= 1
+                if score > value:
+                    value = score
+                    best_col = col
+                if value > alpha:
+                    alpha = value
                 if beta <= alpha:
                     break
-            return value
+            return value, best_col
 
         value = math.inf
-        for col in valid:
-            self._drop(col, 1)
-            value = min(value, self._minimax(depth - 1, True, alpha, beta))
-            self._undo_drop(col)
-            beta = min(beta, value)
+        for col in moves:
+            bit = 1 << heights[col]
+            heights[col] += 1
+            bb[0] |= bit
+            score = self._minimax(depth - 1, True, alpha, beta)
+            bb[0] ^= bit
+            heights[col] -= 1
+            if score < value:
+                value = score
+                best_col = col
+            if value < beta:
+                beta = value
             if beta <= alpha:
                 break
-        return value
+        return value, best_col
 
     def _evaluate_position(self) -> int:
         """Heuristic evaluation from AI perspective (player 2)."""
-        score = 0
-
+        bb_human, bb_ai = self._bb
         # Center control is typically strongest in Connect 4.
-        center_col = self.cols // 2
-        center_count = sum(1 for r in range(self.rows) if self.board[r][center_col] == 2)
-        score += center_count * 6
-
-        # Horizontal windows
-        for r in range(self.rows):
-            for c in range(self.cols - 3):
-                score += self._score_window([self.board[r][c + i] for i in range(4)])
-        # Vertical windows
-        for c in range(self.cols):
-            for r in range(self.rows - 3):
-                score += self._score_window([self.board[r + i][c] for i in range(4)])
-        # Diagonal down-right windows
-        for r in range(self.rows - 3):
-            for c in range(self.cols - 3):
-                score += self._score_window([self.board[r + i][c + i] for i in range(4)])
-        # Diagonal up-right windows
-        for r in range(3, self.rows):
-            for c in range(self.cols - 3):
-                score += self._score_window([self.board[r - i][c + i] for i in range(4)])
-
+        score = (bb_ai & self._center_mask).bit_count() * 6
+        for window in self._windows:
+            score += _WINDOW_SCORES[(bb_ai & window).bit_count() * 5 + (bb_human & window).bit_count()]
         return score
 
-    @staticmethod
-    def _score_window(window: list[int]) -> int:
-        ai = window.count(2)
-        human = window.count(1)
-        empty = window.count(0)
-
-        if ai == 4:
-            return 100_000
-        if ai == 3 and empty == 1:
-            return 120
-        if ai == 2 and empty == 2:
-            return 15
-        if human == 4:
-            return -100_000
-        if human == 3 and empty == 1:
-            return -140
-        if human == 2 and empty == 2:
-            return -10
-        return 0
-
     def _draw_square(self, builder: dp.DotPadBuilder, row: int, col: int) -> None:
         """Draw a 5x5 square token."""
         builder.draw_rectangle(row, col, row + 4, col + 4)
@@ -230,31 +379,37 @@ class Connect4:
         builder.draw_diag_line(row + 2, col, 3, "ltr")
         builder.draw_diag_line(row + 2, col + 4, 3, "rtl")
 
-    def render(self, pad: dp.DotPad) -> None:
-        """Render the current game state to the DotPad.
-
-        Args:
-            pad: DotPad instance.
-        """
-        builder = pad.builder()
+    def frame(self) -> tuple[list[bytes], str]:
+        """Build the display rows and status line for the current game state."""
+        key = (self._bb[0], self._bb[1], self.sel_col, self.winner)
+        if key == self._frame_key:
+            return self._last_frame
+        builder = dp.DotPadBuilder.empty()
 
         top = 1
         left = 1
         cell_w = 8
         cell_h = 6
 
-        # Draw pieces
-        for r in range(self.rows):
-            for c in range(self.cols):
-                val = self.board[r][c]
-                if val == 0:
-                    continue
+        # Pieces never move once dropped, so keep their layer between frames
+        # and draw only the new ones.
+        if self._piece_cells is None:
+            placed = [(r, c) for r in range(self.rows) for c in range(self.cols) if self.board[r][c]]
+        else:
+            builder.buffer.cells[:] = self._piece_cells
+            placed = self._dirty_pieces
+        for r, c in placed:
+            player = self.board[r][c]
+            glyph = self._glyphs.get((player, r, c))
+            if glyph is None:
                 base_row = top + r * cell_h + 1
                 base_col = left + c * cell_w + 2
-                if val == 1:
-                    self._draw_square(builder, base_row, base_col)
-                else:
-                    self._draw_circle(builder, base_row, base_col)
+                draw = self._draw_square if player == 1 else self._draw_circle
+                glyph = glyph_cells(lambda b: draw(b, base_row, base_col))
+                self._glyphs[(player, r, c)] = glyph
+            stamp_cells(builder, glyph)
+        self._piece_cells = builder.buffer.cells[:]
+        self._dirty_pieces = []
 
         # Caret indicator at bottom while game is active.
         if self.winner is None:
@@ -262,21 +417,15 @@ class Connect4:
             cursor_col = left + self.sel_col * cell_w + 2
             builder.draw_line(cursor_row, cursor_col, 5)
 
-        rows = builder.rows()
-        if self._last_rows is None:
-            for i, row_bytes in enumerate(rows, start=1):
-                pad.send_display_line(i, row_bytes)
-        else:
-            for i, row_bytes in enumerate(rows, start=1):
-                if row_bytes != self._last_rows[i - 1]:
-                    pad.send_display_line(i, row_bytes)
-        self._last_rows = rows
-
         if self.winner == -1:
-            send_status(pad, "DRAW F3 MENU")
+            status = "DRAW F3 MENU"
         elif self.winner == 1:
-            send_status(pad, "YOU WIN F3 MENU")
+            status = "YOU WIN F3 MENU"
         elif self.winner == 2:
-            send_status(pad, "YOU LOSE F3 MENU")
+            status = "YOU LOSE F3 MENU"
         else:
-            send_status(pad, "PAN MOVE F2 DROP")
+            status = "PAN MOVE F2 DROP"
+
+        self._frame_key = key
+        self._last_frame = (builder.rows(), status)
+        return self._last_frame
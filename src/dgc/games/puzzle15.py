@@ -8,11 +8,11 @@ from dataclasses import dataclass
 from typing import Optional
 
 import dotpad as dp
-from .utils import send_status
+from .utils import FrameRenderer
 
 
 @dataclass
-class Puzzle15:
+class Puzzle15(FrameRenderer):
     """15-puzzle sliding tile game (single-player, no AI)."""
 
     def __post_init__(self) -> None:
@@ -25,6 +25,7 @@ class Puzzle15:
         self.winner: Optional[str] = None
         self.moves: int = 0
         self._last_rows: list[bytes] | None = None
+        self._last_status: str | None = None
         self.board = self._make_solvable_board()
 
     # ------------------------------------------------------------------
@@ -254,13 +255,9 @@ class Puzzle15:
     _CELL_W = 14
     _CELL_H = 9
 
-    def render(self, pad: dp.DotPad) -> None:
-        """Render the current game state to the DotPad.
-
-        Args:
-            pad: DotPad instance.
-        """
-        builder = pad.builder()
+    def frame(self) -> tuple[list[bytes], str]:
+        """Build the display rows and status line for the current game state."""
+        builder = dp.DotPadBuilder.empty()
         top = self._TOP
         left = self._LEFT
         cw = self._CELL_W
@@ -302,17 +299,9 @@ class Puzzle15:
             focus_col = left + self.sel_col * cw + 4
             builder.draw_line(focus_row, focus_col, 6)
 
-        rows = builder.rows()
-        if self._last_rows is None:
-            for i, row_bytes in enumerate(rows, start=1):
-                pad.send_display_line(i, row_bytes)
-        else:
-            for i, row_bytes in enumerate(rows, start=1):
-                if row_bytes != self._last_rows[i - 1]:
-                    pad.send_display_line(i, row_bytes)
-        self._last_rows = rows
-
         if self.winner == "player":
-            send_status(pad, "SOLVED F3 MENU")
+            status = "SOLVED F3 MENU"
         else:
-            send_status(pad, "MOVE F2 SLIDE F3 SOLVE")
+            status = "MOVE F2 SLIDE F3 SOLVE"
+
+        return builder.rows(), status
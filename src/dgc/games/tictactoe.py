@@ -3,29 +3,73 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 import dotpad as dp
-from .utils import send_status
+from .utils import FrameRenderer, glyph_cells, stamp_cells
+
+# Transposition-table entry flags: exact value, lower bound, upper bound.
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+# Squares tried below the root, center then corners then edges, so strong
+# replies set the alpha-beta bounds early.
+_SEARCH_ORDER: tuple[int, ...] = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# The eight winning lines as bit masks over squares r * 3 + c.
+_LINE_MASKS: tuple[int, ...] = tuple(
+    (1 << a) | (1 << b) | (1 << c)
+    for a, b, c in (
+        (0, 1, 2), (3, 4, 5), (6, 7, 8),
+        (0, 3, 6), (1, 4, 7), (2, 5, 8),
+        (0, 4, 8), (2, 4, 6),
+    )
+)
+_FULL = (1 << 9) - 1
+
+
+def _has_line(bb: int) -> bool:
+    """Return True if the bitboard holds a complete line."""
+    for mask in _LINE_MASKS:
+        if bb & mask == mask:
+            return True
+    return False
+
 
 @dataclass
-class TicTacToe:
+class TicTacToe(FrameRenderer):
     """Tic Tac Toe game with simple AI."""
 
     player_mark: str = "X"
     ai_mark: str = "O"
+    # Search results keyed by both bitboards and the side to move; values
+    # depend only on which side owns each square, so the table is shared by
+    # every game.
+    _tt: ClassVar[dict[int, tuple[int, int]]] = {}
+    # Drawn mark cells keyed by (is X, square), shared by every game.
+    _glyphs: ClassVar[dict[tuple[bool, int], tuple[tuple[int, int], ...]]] = {}
 
     def __post_init__(self) -> None:
         self.reset()
 
     def reset(self) -> None:
         """Reset the game state."""
-        self.board = [["" for _ in range(3)] for _ in range(3)]
+        # Bitboards per side (index 0 player, 1 AI), bit r * 3 + c per square;
+        # the only record of the position.
+        self._bb = [0, 0]
         self.sel_row = 0
         self.sel_col = 0
         self.turn = "player"
         self.winner: Optional[str] = None
+        # Marks placed per side, so callers can spot a move without a board scan.
+        self.marks_placed: dict[str, int] = {self.player_mark: 0, self.ai_mark: 0}
         self._last_rows: list[bytes] | None = None
+        self._last_status: str | None = None
+        # Last frame() result and the state it was built from.
+        self._frame_key: tuple | None = None
+        self._last_frame: tuple[list[bytes], str] | None = None
+        # Cached cells of the grid and mark layer plus the squares marked since.
+        self._mark_cells: list[int] | None = None
+        self._dirty_marks: list[int] = []
 
     def handle_key(self, names: list[str]) -> None:
         """Handle DotPad key inputs.
@@ -46,10 +90,26 @@ class TicTacToe:
         if "f2" in names:
             self._place_player()
 
+    @property
+    def board(self) -> list[list[str]]:
+        """Marks by row and column ("" when empty), built from the bitboards."""
+        return [[self._mark_at(r * 3 + c) for c in range(3)] for r in range(3)]
+
+    def _mark_at(self, idx: int) -> str:
+        """Return the mark on square idx (r * 3 + c), or "" when empty."""
+        if self._bb[0] >> idx & 1:
+            return self.player_mark
+        if self._bb[1] >> idx & 1:
+            return self.ai_mark
+        return ""
+
     def _place_player(self) -> None:
-        if self.board[self.sel_row][self.sel_col] != "":
+        idx = self.sel_row * 3 + self.sel_col
+        if (self._bb[0] | self._bb[1]) >> idx & 1:
             return
-        self.board[self.sel_row][self.sel_col] = self.player_mark
+        self._bb[0] |= 1 << idx
+        self._dirty_marks.append(idx)
+        self.marks_placed[self.player_mark] += 1
         self._update_winner()
 
     def run_ai_turn(self) -> bool:
@@ -64,66 +124,96 @@ class TicTacToe:
         if move is None:
             return
         r, c = move
-        self.board[r][c] = self.ai_mark
+        self._bb[1] |= 1 << (r * 3 + c)
+        self._dirty_marks.append(r * 3 + c)
+        self.marks_placed[self.ai_mark] += 1
         self._update_winner()
 
     def _update_winner(self) -> None:
         winner = self._check_winner()
         if winner:
             self.winner = winner
-        elif all(self.board[r][c] != "" for r in range(3) for c in range(3)):
+        elif self._bb[0] | self._bb[1] == _FULL:
             self.winner = "draw"
 
     def _check_winner(self) -> Optional[str]:
-        lines = []
-        lines.extend(self.board)
-        lines.extend([[self.board[r][c] for r in range(3)] for c in range(3)])
-        lines.append([self.board[i][i] for i in range(3)])
-        lines.append([self.board[i][2 - i] for i in range(3)])
-        for line in lines:
-            if line[0] and all(cell == line[0] for cell in line):
-                return line[0]
+        if _has_line(self._bb[0]):
+            return self.player_mark
+        if _has_line(self._bb[1]):
+            return self.ai_mark
         return None
 
     def _best_move(self) -> Optional[tuple[int, int]]:
+        bb = self._bb
         best_score = -2
         best = None
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == "":
-                    self.board[r][c] = self.ai_mark
-                    score = self._minimax(False)
-                    self.board[r][c] = ""
-                    if score > best_score:
-                        best_score = score
-                        best = (r, c)
+        for idx in range(9):
+            bit = 1 << idx
+            if not (bb[0] | bb[1]) & bit:
+                bb[1] |= bit
+                # Later moves only need to prove they beat the best so far.
+                score = self._minimax(False, best_score, 2)
+                bb[1] ^= bit
+                if score > best_score:
+                    best_score = score
+                    best = divmod(idx, 3)
         return best
 
-    def _minimax(self, maximizing: bool) -> int:
-        winner = self._check_winner()
-        if winner == self.ai_mark:
+    def _minimax(self, maximizing: bool, alpha: int = -2, beta: int = 2) -> int:
+        """Return the game value for the AI with alpha-beta pruning."""
+        player, ai = self._bb
+        key = player | ai << 9 | maximizing << 18
+        entry = self._tt.get(key)
+        if entry is not None:
+            flag, value = entry
+            if flag == _EXACT or (flag == _LOWER and value >= beta) or (flag == _UPPER and value <= alpha):
+                return value
+
+        # Only the side that just moved can have completed a line.
+        if maximizing:
+            if _has_line(player):
+                return -1
+        elif _has_line(ai):
             return 1
-        if winner == self.player_mark:
-            return -1
-        if all(self.board[r][c] != "" for r in range(3) for c in range(3)):
+        if player | ai == _FULL:
             return 0
 
+        best = self._search_moves(maximizing, alpha, beta)
+        if best <= alpha:
+            flag = _UPPER
+        elif best >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._tt[key] = (flag, best)
+        return best
+
+    def _search_moves(self, maximizing: bool, alpha: int, beta: int) -> int:
+        """Search every empty square for the side to move."""
+        bb = self._bb
+        free = ~(bb[0] | bb[1])
         if maximizing:
             best = -2
-            for r in range(3):
-                for c in range(3):
-                    if self.board[r][c] == "":
-                        self.board[r][c] = self.ai_mark
-                        best = max(best, self._minimax(False))
-                        self.board[r][c] = ""
+            for idx in _SEARCH_ORDER:
+                bit = 1 << idx
+                if free & bit:
+                    bb[1] |= bit
+                    best = max(best, self._minimax(False, alpha, beta))
+                    bb[1] ^= bit
+                    alpha = max(alpha, best)
+                    if alpha >= beta:
+                        return best
             return best
         best = 2
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == "":
-                    self.board[r][c] = self.player_mark
-                    best = min(best, self._minimax(True))
-                    self.board[r][c] = ""
+        for idx in _SEARCH_ORDER:
+            bit = 1 << idx
+            if free & bit:
+                bb[0] |= bit
+                best = min(best, self._minimax(True, alpha, beta))
+                bb[0] ^= bit
+                beta = min(beta, best)
+                if beta <= alpha:
+                    return best
         return best
 
     def _draw_x(self, builder: dp.DotPadBuilder, row: int, col: int, size: int) -> None:
@@ -144,13 +234,12 @@ class TicTacToe:
         builder.draw_diag_line(row + size - 2, col + 1, 2, "ltr")
         builder.draw_diag_line(row + size - 2, col + size - 2, 2, "rtl")
 
-    def render(self, pad: dp.DotPad) -> None:
-        """Render the current game state to the DotPad.
-
-        Args:
-            pad: DotPad instance.
-        """
-        builder = pad.builder()
+    def frame(self) -> tuple[list[bytes], str]:
+        """Build the display rows and status line for the current game state."""
+        key = (self._bb[0], self._bb[1], self.sel_row, self.sel_col, self.winner)
+        if key == self._frame_key:
+            return self._last_frame
+        builder = dp.DotPadBuilder.empty()
 
         top = 1
         left = 1
@@ -158,27 +247,35 @@ class TicTacToe:
         cell_h = 12
         total_h = cell_h * 3 + 1
 
-        # Grid lines
-        for i in range(1, 3):
-            col = left + i * cell_w
-            builder.draw_vline(top, col, total_h)
-        for i in range(1, 3):
-            row = top + i * cell_h
-            builder.draw_line(row, left, cell_w * 3)
+        # The grid is static and marks never move, so keep that layer between
+        # frames and draw only the new marks.
+        if self._mark_cells is None:
+            for i in range(1, 3):
+                col = left + i * cell_w
+                builder.draw_vline(top, col, total_h)
+            for i in range(1, 3):
+                row = top + i * cell_h
+                builder.draw_line(row, left, cell_w * 3)
+            marked = [idx for idx in range(9) if (self._bb[0] | self._bb[1]) >> idx & 1]
+        else:
+            builder.buffer.cells[:] = self._mark_cells
+            marked = self._dirty_marks
 
         # Pieces (graphical X/O, not braille letters)
-        for r in range(3):
-            for c in range(3):
-                mark = self.board[r][c]
-                if not mark:
-                    continue
+        for idx in marked:
+            mark = self._mark_at(idx)
+            glyph = self._glyphs.get((mark == "X", idx))
+            if glyph is None:
+                r, c = divmod(idx, 3)
                 mark_row = top + r * cell_h + 2
                 mark_col = left + c * cell_w + 5
                 mark_size = 8
-                if mark == "X":
-                    self._draw_x(builder, mark_row, mark_col, mark_size)
-                else:
-                    self._draw_o(builder, mark_row, mark_col, mark_size)
+                draw = self._draw_x if mark == "X" else self._draw_o
+                glyph = glyph_cells(lambda b: draw(b, mark_row, mark_col, mark_size))
+                self._glyphs[(mark == "X", idx)] = glyph
+            stamp_cells(builder, glyph)
+        self._mark_cells = builder.buffer.cells[:]
+        self._dirty_marks = []
 
         # Focus indicator (short line below selected cell) while game is active.
         if self.winner is None:
@@ -186,21 +283,15 @@ class TicTacToe:
             focus_col = left + self.sel_col * cell_w + 6
             builder.draw_line(focus_row, focus_col, 6)
 
-        rows = builder.rows()
-        if self._last_rows is None:
-            for i, row_bytes in enumerate(rows, start=1):
-                pad.send_display_line(i, row_bytes)
-        else:
-            for i, row_bytes in enumerate(rows, start=1):
-                if row_bytes != self._last_rows[i - 1]:
-                    pad.send_display_line(i, row_bytes)
-        self._last_rows = rows
-
         if self.winner == "draw":
-            send_status(pad, "DRAW F3 MENU")
+            status = "DRAW F3 MENU"
         elif self.winner == self.player_mark:
-            send_status(pad, "YOU WIN F3 MENU")
+            status = "YOU WIN F3 MENU"
         elif self.winner == self.ai_mark:
-            send_status(pad, "YOU LOSE F3 MENU")
+            status = "YOU LOSE F3 MENU"
         else:
-            send_status(pad, "PAN/F1/F4 MOVE F2 PLACE")
+            status = "PAN/F1/F4 MOVE F2 PLACE"
+
+        self._frame_key = key
+        self._last_frame = (builder.rows(), status)
+        return self._last_frame
@@ -1,5 +1,20 @@
 """Shared helpers for game rendering."""
 
+from functools import lru_cache
+from itertools import count
+import time
+
+from dotpad import DotPadBuilder
+from dotpad.braille import encode_text_to_cells
+from dotpad.serial_driver import Packet, PacketType, ResponseCode
+
+# Times a display line is sent before it counts as failed.
+_LINE_ATTEMPTS = 3
+# Seconds to wait for the reply to one display line.
+_REPLY_TIMEOUT = 1.0
+# Seconds to wait before resending a line the device answered with WAIT.
+_WAIT_BACKOFF = 0.05
+
 
 def row_to_dot(line: int) -> int:
     """Convert a 1-based line index to a dot row.
@@ -13,6 +28,153 @@ def row_to_dot(line: int) -> int:
     return (line - 1) * 4 + 1
 
 
-def send_status(pad, message: str) -> None:
-    """Send a fixed-width 20-cell status line with Nemeth/no number sign."""
-    pad.send_text(message[:20].ljust(20), use_number_sign=False, use_nemeth=True)
+def glyph_cells(draw) -> tuple[tuple[int, int], ...]:
+    """Run draw(builder) on an empty builder and return its (cell index, dots) pairs.
+
+    The result can be replayed with stamp_cells instead of repeating the
+    drawing calls.
+    """
+    builder = DotPadBuilder.empty()
+    draw(builder)
+    return tuple((idx, dots) for idx, dots in enumerate(builder.buffer.cells) if dots)
+
+
+def stamp_cells(builder, glyph: tuple[tuple[int, int], ...]) -> None:
+    """OR a glyph from glyph_cells into the builder's cells."""
+    cells = builder.buffer.cells
+    for idx, dots in glyph:
+        cells[idx] |= dots
+
+
+@lru_cache(maxsize=256)
+def status_cells(message: str) -> bytes:
+    """Return the braille cells for a fixed-width 20-cell status line."""
+    return bytes(encode_text_to_cells(message[:20].ljust(20), use_number_sign=False, use_nemeth=True))
+
+
+def send_status(pad, message: str, on_packet=None) -> bool:
+    """Send a fixed-width 20-cell status line with Nemeth/no number sign.
+
+    Returns True if the device acknowledged it; see send_display_lines.
+    """
+    return send_display_lines(pad, [(0, status_cells(message))], on_packet)
+
+
+def send_display_lines(pad, lines, on_packet=None) -> bool:
+    """Send display lines one at a time, waiting for each line's reply.
+
+    A line answered with WAIT or NAK, or not answered in time, is sent again,
+    up to _LINE_ATTEMPTS times in all.
+
+    Args:
+        pad: DotPad instance.
+        lines: Iterable of (destination, cells) pairs.
+        on_packet: Optional callable given any other packet read while waiting
+            for replies, such as a key notification, so it is not lost.
+
+    Returns:
+        True if every line was acknowledged. Sending stops at the first line
+        that is not, so callers should redraw in full next time.
+    """
+    ser = getattr(pad, "_ser", None)
+    for dest, cells in lines:
+        if ser is None:
+            # Not a serial-backed pad; use the per-line path.
+            sent = pad.send_display_line(dest, cells)
+        else:
+            packet = Packet.make_packet(PacketType.REQ_DISPLAY_LINE, args=bytes([0]) + cells, destination=dest)
+            sent = _send_line(pad, ser, packet, on_packet)
+        if not sent:
+            return False
+    return True
+
+
+def _send_line(pad, ser, packet: bytes, on_packet) -> bool:
+    """Write one display line packet until the device acknowledges it."""
+    for _ in range(_LINE_ATTEMPTS):
+        ser.write(packet)
+        code = _read_line_reply(pad, on_packet)
+        if code == ResponseCode.ACK:
+            return True
+        if code == ResponseCode.WAIT:
+            time.sleep(_WAIT_BACKOFF)
+    return False
+
+
+def _read_line_reply(pad, on_packet) -> ResponseCode | None:
+    """Return the reply code for a sent display line, or None if none came."""
+    deadline = time.monotonic() + _REPLY_TIMEOUT
+    while (remaining := deadline - time.monotonic()) > 0:
+        pkt = pad.read_packet(timeout=remaining)
+        if not pkt or pkt.packet_type is None:
+            # Nothing complete yet; keep waiting until the deadline.
+            continue
+        if pkt.packet_type == PacketType.NTF_DISPLAY_LINE:
+            return ResponseCode.ACK
+        if pkt.packet_type == PacketType.RSP_DISPLAY_LINE:
+            return ResponseCode.from_code(pkt.args[0]) if pkt.args else ResponseCode.NAK
+        if on_packet is not None:
+            on_packet(pkt)
+    return None
+
+
+def changed_lines(rows: list[bytes], last_rows: list[bytes] | None) -> list[tuple[int, bytes]]:
+    """Return (line, cells) pairs for rows that differ from last_rows (all when None)."""
+    if last_rows is None:
+        return list(enumerate(rows, start=1))
+    return [(i, row_bytes) for i, row_bytes, old in zip(count(1), rows, last_rows) if row_bytes != old]
+
+
+def send_game_frame(
+    pad,
+    rows: list[bytes],
+    last_rows: list[bytes] | None,
+    status: str,
+    last_status: str | None = None,
+    on_packet=None,
+) -> bool:
+    """Send display rows that differ from last_rows (all when None), then the
+    status line unless it matches last_status.
+
+    on_packet receives non-ack packets read meanwhile; see send_display_lines.
+    Returns True if the pad acknowledged everything sent.
+    """
+    if not send_display_lines(pad, changed_lines(rows, last_rows), on_packet):
+        return False
+    return status == last_status or send_status(pad, status, on_packet)
+
+
+class FrameRenderer:
+    """Send a game's frame() to the DotPad, skipping what the pad already shows.
+
+    Games provide frame() and keep _last_rows and _last_status, set to None
+    whenever the whole frame must be sent again.
+    """
+
+    _last_rows: list[bytes] | None
+    _last_status: str | None
+
+    def frame(self) -> tuple[list[bytes], str]:
+        """Return the display rows and status line for the current state."""
+        raise NotImplementedError
+
+    def render(self, pad) -> None:
+        """Render the current game state to the DotPad.
+
+        Args:
+            pad: DotPad instance.
+        """
+        self.send_frame(pad, *self.frame())
+
+    def send_frame(self, pad, rows: list[bytes], status: str, on_packet=None) -> None:
+        """Send rows and status from frame(), skipping whatever is unchanged since the last frame.
+
+        on_packet receives key packets that arrive while rows are acknowledged.
+        """
+        if send_game_frame(pad, rows, self._last_rows, status, self._last_status, on_packet):
+            self._last_rows = rows
+            self._last_status = status
+        else:
+            # Some of it may not have reached the pad; send everything next time.
+            self._last_rows = None
+            self._last_status = None
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import operator
 import sys
 import tempfile
+import threading
 from array import array
+from itertools import repeat
 from pathlib import Path
 
 try:
@@ -19,6 +23,23 @@ else:
 _LOG_PATH = Path(tempfile.gettempdir()) / "dgc_sound.log"
 
 
+@functools.lru_cache(maxsize=8)
+def _gain_table(volume: float) -> tuple[int, ...]:
+    """Return scaled, clamped values for every int16 sample at this volume.
+
+    Entries for negative samples sit at the end, so the table is indexed by
+    the sample itself.
+    """
+    return tuple(
+        max(-32768, min(32767, int((i if i < 32768 else i - 65536) * volume))) for i in range(65536)
+    )
+
+
+def _mix_pcm(a: array, b: array) -> array:
+    """Add two equal-length SIGNED16 chunks, clamping to the int16 range."""
+    return array("h", map(max, repeat(-32768), map(min, repeat(32767), map(operator.add, a, b))))
+
+
 def _log(msg: str) -> None:
     """Append a timestamped message to the sound diagnostic log."""
     try:
@@ -29,12 +50,23 @@ def _log(msg: str) -> None:
 
 
 class SoundManager:
-    """Best-effort sound playback for short game effects."""
+    """Best-effort sound playback for short game effects.
+
+    One playback device is opened on first use. It plays a mix of every
+    active one-shot stream, stops once they have all finished and starts
+    again on the next play().
+    """
+
+    # Active streams beyond this are dropped oldest-first.
+    _MAX_VOICES = 24
 
     def __init__(self) -> None:
         self._enabled = True
-        self._loaded = False
-        self._playbacks: list[tuple[object, object]] = []
+        self._device: object | None = None
+        self._voices: list[object] = []
+        self._voices_lock = threading.Lock()
+        # Serializes starting and stopping the device.
+        self._device_lock = threading.Lock()
         self._base = self._resolve_sounds_dir()
         self._files = {
             "win": self._base / "win.ogg",
@@ -53,7 +85,10 @@ class SoundManager:
             "hit": 0.5,
             "place": 0.5,
         }
-        self._load()
+        # Decoded stereo SIGNED16 samples per event, volume already applied.
+        self._pcm: dict[str, array] = {}
+        # Decode off the UI thread; effects play once their samples are ready.
+        threading.Thread(target=self._load, daemon=True).start()
 
     @staticmethod
     def _resolve_sounds_dir() -> Path:
@@ -82,58 +117,110 @@ class SoundManager:
         return self._enabled
 
     def close(self) -> None:
-        """Stop and release any active playback devices."""
+        """Stop and release the playback device."""
         self._enabled = False
-        while self._playbacks:
-            self._dispose_playback(self._playbacks.pop())
+        with self._voices_lock:
+            self._voices.clear()
+        with self._device_lock:
+            device, self._device = self._device, None
+        if device is None:
+            return
+        for method_name in ("stop", "close"):
+            method = getattr(device, method_name, None)
+            if callable(method):
+                try:
+                    method()
+                except Exception:
+                    pass
 
     def _load(self) -> None:
+        """Decode every available effect into _pcm."""
         if miniaudio is None:
             _log(f"miniaudio not available (import failed: {_IMPORT_ERROR})")
             return
-        try:
-            self._loaded = any(path.exists() for path in self._files.values())
-            if not self._loaded:
-                _log(f"no sound files found in {self._base}")
-        except Exception as e:
-            _log(f"_load error: {type(e).__name__}: {e}")
-            self._loaded = False
+        for event, path in self._files.items():
+            try:
+                if not path.exists():
+                    continue
+                decoded = miniaudio.decode_file(str(path))
+                self._pcm[event] = self._scale_pcm(decoded.samples, self._volumes.get(event, 1.0))
+            except Exception as e:
+                _log(f"_load({event}) error: {type(e).__name__}: {e}")
+        if not self._pcm:
+            _log(f"no sound files found in {self._base}")
 
     def play(self, event: str) -> None:
         """Play a one-shot sound event if available."""
-        if not self._enabled or not self._loaded or miniaudio is None:
+        if not self._enabled or miniaudio is None:
             return
-        path = self._files.get(event)
-        if path is None or not path.exists():
+        samples = self._pcm.get(event)
+        if samples is None:
             return
         try:
-            volume = self._volumes.get(event, 1.0)
-            # Keep device and generator refs alive so one-shots can finish.
-            if len(self._playbacks) >= 24:
-                stale = self._playbacks[:-23]
-                self._playbacks = self._playbacks[-23:]
-                for playback in stale:
-                    self._dispose_playback(playback)
-            device = miniaudio.PlaybackDevice()
-            stream = self._scaled_stream(str(path), volume)
+            stream = self._pcm_stream(samples)
             next(stream)
-            device.start(stream)
-            self._playbacks.append((device, stream))
+            with self._voices_lock:
+                if len(self._voices) >= self._MAX_VOICES:
+                    del self._voices[: len(self._voices) - self._MAX_VOICES + 1]
+                self._voices.append(stream)
+            with self._device_lock:
+                if self._device is None:
+                    self._device = miniaudio.PlaybackDevice()
+                if not self._device.running:
+                    mixer = self._mix_stream()
+                    next(mixer)
+                    self._device.start(mixer)
         except Exception as e:
             _log(f"play({event}) error: {type(e).__name__}: {e}")
             return
 
-    @staticmethod
-    def _dispose_playback(playback: tuple[object, object]) -> None:
-        """Best-effort cleanup for a one-shot playback device."""
-        device, _stream = playback
-        for method_name in ("stop", "close"):
-            method = getattr(device, method_name, None)
-            if callable(method):
+    def _stop_if_idle(self) -> None:
+        """Stop the playback device unless a stream was added since it went idle."""
+        with self._device_lock:
+            with self._voices_lock:
+                idle = not self._voices
+            device = self._device
+            if idle and device is not None and device.running:
                 try:
-                    method()
+                    device.stop()
+                except Exception as e:
+                    _log(f"stop error: {type(e).__name__}: {e}")
+
+    def _mix_stream(self):
+        """Feed the playback device the sum of all active streams, or silence."""
+        silence = array("h")
+        stop_requested = False
+        required_frames = yield
+        while True:
+            size = required_frames * 2  # stereo samples
+            with self._voices_lock:
+                voices = list(self._voices)
+            mixed = None
+            for voice in voices:
+                try:
+                    chunk = voice.send(required_frames)
                 except Exception:
-                    pass
+                    # Finished (or failed) streams leave the mix.
+                    with self._voices_lock:
+                        if voice in self._voices:
+                            self._voices.remove(voice)
+                    continue
+                if len(chunk) < size:
+                    chunk = chunk + array("h", bytes(2 * (size - len(chunk))))
+                mixed = chunk if mixed is None else _mix_pcm(mixed, chunk)
+            with self._voices_lock:
+                idle = not self._voices
+            if not idle:
+                stop_requested = False
+            elif not stop_requested:
+                # The device cannot be stopped from its own callback.
+                threading.Thread(target=self._stop_if_idle, daemon=True).start()
+                stop_requested = True
+            if mixed is None:
+                if len(silence) != size:
+                    silence = array("h", bytes(2 * size))
+                mixed = silence
+            required_frames = yield mixed
 
     @staticmethod
     def _scale_pcm(chunk: object, volume: float) -> object:
@@ -142,25 +229,16 @@ class SoundManager:
             return chunk
         if not isinstance(chunk, array) or chunk.typecode != "h":
             return chunk
-        # Clamp to int16 range after gain.
-        return array("h", (max(-32768, min(32767, int(sample * volume))) for sample in chunk))
+        # Look up each sample's clamped gain instead of computing it in Python.
+        return array("h", map(_gain_table(volume).__getitem__, chunk))
 
     @staticmethod
-    def _scaled_stream(filename: str, volume: float):
-        """Stream PCM from file and apply software gain safely."""
-        source = miniaudio.stream_file(filename)
+    def _pcm_stream(samples: array):
+        """Stream decoded stereo samples in the chunk sizes the mixer asks for."""
         required_frames = yield
-        silence = None
-        while True:
-            try:
-                if required_frames is None:
-                    chunk = next(source)
-                else:
-                    chunk = source.send(required_frames)
-                if silence is None and isinstance(chunk, array):
-                    silence = array(chunk.typecode, [0] * len(chunk))
-                required_frames = yield SoundManager._scale_pcm(chunk, volume)
-            except StopIteration:
-                if silence is None:
-                    silence = array("h")
-                required_frames = yield silence
+        pos = 0
+        while pos < len(samples):
+            end = pos + required_frames * 2
+            chunk = samples[pos:end]
+            pos = end
+            required_frames = yield chunk
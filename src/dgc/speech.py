@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+import threading
+from collections import deque
 from typing import Optional
 
 try:
@@ -9,43 +12,113 @@ try:
 except Exception:  # pragma: no cover - optional runtime dependency
     Auto = None
 
+# SAPI5 and JAWS are COM objects, so the speech thread needs COM initialized.
+pythoncom = None
+if sys.platform == "win32":
+    try:
+        import pythoncom
+    except Exception:  # pragma: no cover - pywin32 ships with accessible_output2
+        pythoncom = None
+
 
 class SpeechOutput:
-    """Best-effort speech output wrapper."""
+    """Best-effort speech output wrapper.
+
+    The backend is created and called on a daemon thread so a slow screen
+    reader or TTS engine never stalls startup or the UI thread. Text spoken
+    while the backend is still loading is queued until it is ready.
+    """
+
+    # Pending utterances beyond this are dropped oldest-first.
+    _MAX_PENDING = 4
 
     def __init__(self) -> None:
         self._speaker: Optional[object] = None
-        if Auto is None:
+        self._pending: deque[tuple[str, bool]] = deque(maxlen=self._MAX_PENDING)
+        self._cv = threading.Condition()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+        # Cleared if the backend is missing or fails to start.
+        self._available = Auto is not None
+        if not self._available:
             return
-        try:
-            self._speaker = Auto()
-        except Exception:
-            self._speaker = None
+        self._thread = threading.Thread(target=self._speak_loop, daemon=True)
+        self._thread.start()
 
     @property
     def enabled(self) -> bool:
-        """Return True if speech backend initialized."""
-        return self._speaker is not None
+        """Return True unless the speech backend is missing or failed to start."""
+        return self._available
 
     def speak(self, text: str, interrupt: bool = True) -> None:
-        """Speak text if backend is available."""
-        if not text or self._speaker is None:
+        """Queue text for speech if backend is available."""
+        if not text or not self._available:
             return
+        with self._cv:
+            if interrupt:
+                # An interrupting message would cut these off anyway.
+                self._pending.clear()
+            self._pending.append((text, interrupt))
+            self._cv.notify()
+
+    def _speak_loop(self) -> None:
+        """Run the backend on this thread, with COM initialized on Windows."""
+        if pythoncom is not None:
+            pythoncom.CoInitialize()
+        try:
+            self._run_backend()
+        finally:
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def _run_backend(self) -> None:
+        """Start the backend, deliver queued utterances in order, then shut it down."""
         try:
-            self._speaker.speak(text, interrupt=interrupt)
+            speaker = Auto()
         except Exception:
-            # Avoid breaking gameplay if speech engine fails at runtime.
-            pass
+            speaker = None
+        with self._cv:
+            if speaker is None:
+                self._available = False
+                self._pending.clear()
+                return
+            self._speaker = speaker
+        try:
+            while True:
+                with self._cv:
+                    while not self._pending and not self._stop:
+                        self._cv.wait()
+                    if self._stop:
+                        return
+                    text, interrupt = self._pending.popleft()
+                try:
+                    speaker.speak(text, interrupt=interrupt)
+                except Exception:
+                    # Avoid breaking gameplay if speech engine fails at runtime.
+                    pass
+        finally:
+            # COM objects must be released on the thread that created them.
+            with self._cv:
+                self._speaker = None
+            self._shutdown(speaker)
 
     def close(self) -> None:
-        """Release speech backend resources if the backend exposes shutdown hooks."""
-        if self._speaker is None:
-            return
+        """Stop the speech thread, which releases the backend before exiting."""
+        with self._cv:
+            self._stop = True
+            self._pending.clear()
+            self._cv.notify_all()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=0.5)
+        self._thread = None
+
+    @staticmethod
+    def _shutdown(speaker: object) -> None:
+        """Call whichever shutdown hooks the backend exposes."""
         for method_name in ("stop", "close", "shutdown"):
-            method = getattr(self._speaker, method_name, None)
+            method = getattr(speaker, method_name, None)
             if callable(method):
                 try:
                     method()
                 except Exception:
                     pass
-        self._speaker = None
@@ -0,0 +1,64 @@
+"""Battleship state consistency checks over seeded games."""
+
+import random
+
+import pytest
+
+from dgc.games.battleship import SHIP_SIZES, Battleship
+
+
+def _cells_mask(board: bytearray, value: int | None = None) -> int:
+    """Return a bitboard of the cells set in a flat board (equal to value if given)."""
+    mask = 0
+    for idx, cell in enumerate(board):
+        if (cell == value) if value is not None else cell:
+            mask |= 1 << idx
+    return mask
+
+
+def _assert_consistent(game: Battleship) -> None:
+    """Check every bitboard against the bytearray boards it mirrors."""
+    assert game.player_mask == _cells_mask(game.player_board)
+    assert game.player_mask == _cells_mask(game.player_ship_ids)
+    assert game.enemy_mask == _cells_mask(game.enemy_ship_ids)
+    for ship_ids, ship_masks, ship_cells in (
+        (game.player_ship_ids, game._player_ship_masks, game._player_ship_cells),
+        (game.enemy_ship_ids, game._enemy_ship_masks, game._enemy_ship_cells),
+    ):
+        for ship_id, mask in ship_masks.items():
+            assert mask == _cells_mask(ship_ids, ship_id)
+            assert mask == sum(1 << (r * 10 + c) for r, c in ship_cells[ship_id])
+    assert game.player_hits == _cells_mask(game.player_shots, 2)
+    assert game.enemy_hits == _cells_mask(game.enemy_shots, 2)
+    assert not _cells_mask(game.player_shots, 1) & game.enemy_mask
+    assert not _cells_mask(game.enemy_shots, 1) & game.player_mask
+    assert game._enemy_remaining == sum(SHIP_SIZES) - game.player_hits.bit_count()
+    assert game._player_remaining == sum(SHIP_SIZES) - game.enemy_hits.bit_count()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_bitboards_match_boards_through_a_game(seed: int) -> None:
+    random.seed(seed)
+    game = Battleship()
+    _assert_consistent(game)
+    # Place the fleet along even rows, with one overlapping attempt first.
+    game.sel_row, game.sel_col = 0, 0
+    game.handle_key(["f2"])
+    game.handle_key(["f2"])
+    assert game.last_event == "invalid"
+    for ship in range(1, len(SHIP_SIZES)):
+        game.sel_row = ship * 2
+        game.handle_key(["f2"])
+        _assert_consistent(game)
+    assert game.phase == "attack"
+
+    rng = random.Random(seed)
+    order = list(range(100))
+    rng.shuffle(order)
+    while game.winner is None:
+        game.sel_row, game.sel_col = divmod(order.pop(), 10)
+        game.handle_key(["f2"])
+        if game.winner is None:
+            game.run_cpu_turn()
+        _assert_consistent(game)
+    assert game.winner in ("player", "cpu")
@@ -0,0 +1,49 @@
+"""Connect 4 bitboard checks against brute force over seeded positions."""
+
+import random
+
+import pytest
+
+from dgc.games.connect4 import Connect4, _has_four, _win_cells
+
+
+def _random_positions(seed: int):
+    """Yield games after each random drop until someone wins or the board fills."""
+    rng = random.Random(seed)
+    game = Connect4()
+    player = 1
+    while True:
+        valid = game._valid_moves()
+        if not valid:
+            return
+        game._drop(rng.choice(valid), player)
+        if any(_has_four(bb, game._shifts) for bb in game._bb):
+            return
+        yield game
+        player = 3 - player
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_win_cells_match_brute_force(seed: int) -> None:
+    for game in _random_positions(seed):
+        occupied = game._bb[0] | game._bb[1]
+        empty = game._full & ~occupied
+        empty_bits = [1 << idx for idx in range(empty.bit_length()) if empty >> idx & 1]
+        for bb in game._bb:
+            expected = sum(bit for bit in empty_bits if _has_four(bb | bit, game._shifts))
+            assert _win_cells(bb, game._shifts) & empty == expected
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_forced_column_takes_or_blocks_a_win(seed: int) -> None:
+    for game in _random_positions(seed):
+        playable = [(col, 1 << game._heights[col]) for col in game._valid_moves()]
+        ai_wins = [col for col, bit in playable if _has_four(game._bb[1] | bit, game._shifts)]
+        human_wins = [col for col, bit in playable if _has_four(game._bb[0] | bit, game._shifts)]
+        forced = game._forced_column()
+        if ai_wins:
+            assert forced in ai_wins
+        elif len(human_wins) == 1:
+            assert forced == human_wins[0]
+        else:
+            assert forced is None